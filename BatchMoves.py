@@ -0,0 +1,151 @@
+#--------------------------------------------------------------------------------------------------
+# Purpose            : Move generation for lots of boards at once using NumPy
+#                      Boards come in as an (N, 8, 8) int8 array using the same values as the grid
+#                      (NO_CHIP, BLACK_CHIP, WHITE_CHIP) and are turned into arrays of 64-bit
+#                      bitboards (one for the side to move and one for the opponent). Then the
+#                      bitboard shifts in Bitboard.py are done for the whole batch at once in each
+#                      of the eight directions (NORTH ... NORTH_WEST), so the legal moves, flip
+#                      counts and resulting boards for every board come out together without a
+#                      Python loop per cell or per board.
+#                      This needs NumPy (pip install numpy), nothing else in FlipChip does.
+# Date Created       : 17Oct2026
+# Author             : A.S.Harrison
+# Amendment History  : Date         Author          Description
+#                      17Oct2026    A.S.Harrison    Created
+#--------------------------------------------------------------------------------------------------
+
+import numpy as np                                                      # For the vectorised board arithmetic
+import Bitboard                                                         # For the edge masks
+from GameCore import *                                                  # The board constants and directions
+
+# Define all the constants-------------------------------------------------------------------------
+RUN_STEPS = int(COLUMNS - 3)                                            # Times a run of opponent chips gets extended (a run is at most 6 long)
+
+# The shift for each direction. A shift moves every chip one cell in the direction, which is the
+# same as adding the direction to its cell number, and then masks off any that wrapped around
+# the left or right edge (the same as the shift_ functions in Bitboard.py)
+def _edge_mask(intDirection: int):
+    intColStep = DIRECTION_STEPS[intDirection][1]
+    if intColStep == 1: return np.uint64(Bitboard.NOT_WEST_EDGE)        # Moving east, so nothing can end up in the west column
+    if intColStep == -1: return np.uint64(Bitboard.NOT_EAST_EDGE)       # Moving west, so nothing can end up in the east column
+    return np.uint64(Bitboard.FULL_BOARD)
+
+SHIFTS = tuple((np.uint64(abs(d)), d > 0, _edge_mask(d)) for d in DIRECTIONS)    # (amount, left shift?, mask) for each direction
+REVERSE_SHIFTS = tuple((np.uint64(abs(d)), d < 0, _edge_mask(-d)) for d in DIRECTIONS)  # And the same for the opposite directions
+
+
+# Shift a batch of bitboards one cell (see SHIFTS)-------------------------------------------------
+def shift(bits, tplShift: tuple):
+    amount, blnLeft, mask = tplShift
+    if blnLeft: return (bits << amount) & mask
+    return (bits >> amount) & mask
+
+
+# Turn a list of GameCore style grids into an (N, 8, 8) array of boards----------------------------
+def from_grids(lstGrids: list):
+    return np.asarray(lstGrids, dtype = np.int8).reshape(-1, ROWS, COLUMNS)
+
+
+# Turn the side to move into an array of one chip value per board----------------------------------
+def colors_array(colors, intBoards: int):
+    return np.broadcast_to(np.asarray(colors, dtype = np.int8), (intBoards,))
+
+
+# Turn a set of cells on each board ((N, 8, 8) bools) into bitboards (bit n is cell n)-------------
+def to_bits(cells):
+    packed = np.packbits(np.asarray(cells, dtype = bool).reshape(-1, CELLS), axis = 1, bitorder = 'little')
+    return packed.view('<u8').reshape(-1).astype(np.uint64)
+
+
+# And back again-----------------------------------------------------------------------------------
+def from_bits(bits):
+    packed = np.ascontiguousarray(bits, dtype = '<u8').view(np.uint8).reshape(-1, 8)
+    return np.unpackbits(packed, axis = 1, bitorder = 'little').reshape(-1, ROWS, COLUMNS).astype(bool)
+
+
+# Split a batch of boards into bitboards for the side to move and the opponent---------------------
+def sides(boards, colors):
+    boards = np.asarray(boards, dtype = np.int8).reshape(-1, ROWS, COLUMNS)
+    own = colors_array(colors, boards.shape[0]).reshape(-1, 1, 1)
+    return to_bits(boards == own), to_bits(boards == -own)
+
+
+# Work out the legal moves for the player owning own (as bitboards)--------------------------------
+def legal_bits(own, opp):
+    empty = ~(own | opp)
+    moves = np.zeros_like(own)
+    for tplShift in SHIFTS:                                             # For each direction
+        run = shift(own, tplShift) & opp                                # Opponent chips next to one of ours
+        for i in range(RUN_STEPS): run |= shift(run, tplShift) & opp    # Extend the runs of opponent chips
+        moves |= shift(run, tplShift) & empty                           # An empty cell at the end of a run is a legal move
+    return moves
+
+
+# Count the chips that would be flipped by every empty cell of every board-------------------------
+# Working backwards from the cell being played: a cell flips k - 1 chips in a direction if the
+# k - 1 cells that way are opponent chips and the k'th is one of ours. The counts are built up as
+# three bit planes per direction (the 1s, 2s and 4s) so that only those need unpacking
+def flip_counts(own, opp):
+    empty = ~(own | opp)
+    counts = np.zeros((own.shape[0], ROWS, COLUMNS), dtype = np.int16)
+    for tplShift in REVERSE_SHIFTS:                                     # For each direction (shifting back towards the cell)
+        planes = [np.zeros_like(own) for i in range(3)]                 # The count for this direction in binary
+        behind_opp = shift(opp, tplShift)                               # Cells with an opponent chip 1 step away
+        run = behind_opp.copy()                                         # Cells with opponent chips all the way out to k - 1 steps
+        behind_own = shift(own, tplShift)                               # Cells with one of our chips k steps away
+        for k in range(2, COLUMNS):                                     # For each distance to the bounding chip
+            behind_own = shift(behind_own, tplShift)
+            end = run & behind_own & empty                              # Runs of k - 1 that end on one of our chips
+            for b in range(3):
+                if (k - 1) >> b & 1: planes[b] |= end
+            behind_opp = shift(behind_opp, tplShift)
+            run &= behind_opp                                           # Runs that carry on for another opponent chip
+        for b in range(3):
+            counts += from_bits(planes[b]).astype(np.int16) << b
+    return counts
+
+
+# Work out which chips get flipped when each board plays one cell (given as a bitboard)------------
+def flip_bits(own, opp, move):
+    flips = np.zeros_like(own)
+    for tplShift in SHIFTS:                                             # For each direction
+        run = shift(move, tplShift) & opp                               # The run of opponent chips starting next to the move
+        for i in range(RUN_STEPS): run |= shift(run, tplShift) & opp
+        bounded = (shift(run, tplShift) & own) != 0                     # It only flips if it ends on one of our chips
+        flips |= np.where(bounded, run, np.uint64(0))
+    return flips
+
+
+# Work out the legal moves and flip counts for a batch of boards-----------------------------------
+# Returns (legal, flips) - an (N, 8, 8) bool array of legal moves and an (N, 8, 8) array of the
+# number of chips each move would flip (0 for illegal moves)
+def analyse(boards, colors):
+    own, opp = sides(boards, colors)
+    return from_bits(legal_bits(own, opp)), flip_counts(own, opp)
+
+
+# Play one move on each board and return the resulting boards--------------------------------------
+# cells holds one cell number per board (as used by GameCore), or -1 to leave that board alone.
+# Illegal moves are not checked for - use analyse first
+def play(boards, colors, cells):
+    boards = np.asarray(boards, dtype = np.int8).reshape(-1, ROWS, COLUMNS)
+    own_color = colors_array(colors, boards.shape[0])
+    cells = np.asarray(cells, dtype = np.int64).reshape(-1)
+    own, opp = sides(boards, own_color)
+    own_color = own_color.reshape(-1, 1, 1)                             # Line the colours up with the boards
+    move = np.where(cells >= 0, np.left_shift(np.uint64(1), np.maximum(cells, 0).astype(np.uint64)), np.uint64(0))
+    flips = flip_bits(own, opp, move)
+    own |= flips | move                                                 # Plant the chips and take the flipped ones
+    opp &= ~flips                                                       # The opponent loses the flipped chips
+    return (from_bits(own) * own_color - from_bits(opp) * own_color).astype(np.int8)
+
+
+# Play every legal move of every board-------------------------------------------------------------
+# Returns (parents, cells, children) - for each resulting board, which board it came from, the
+# cell that was played and the new board. Handy for expanding a whole layer of a search tree
+def expand(boards, colors):
+    boards = np.asarray(boards, dtype = np.int8).reshape(-1, ROWS, COLUMNS)
+    own_color = colors_array(colors, boards.shape[0])
+    own, opp = sides(boards, own_color)
+    parents, cells = np.nonzero(from_bits(legal_bits(own, opp)).reshape(-1, CELLS)) # Every legal (board, cell)
+    return parents, cells, play(boards[parents], own_color[parents], cells)
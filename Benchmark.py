@@ -0,0 +1,467 @@
+#--------------------------------------------------------------------------------------------------
+# Purpose            : Benchmarks for the FlipChip engine
+#                      perft counts every position reachable to a given depth from the starting
+#                      position and from a set of stored mid-game positions. The counts are done
+#                      with both the bitboard engine and GameCore's list engine (make_move and
+#                      move_points walking the rays out from each cell), so as well as timing them
+#                      it checks they agree with each other and with the stored baseline. Then it
+#                      times move generation, whole games of best_move self-play, the alpha-beta
+#                      search (on one process and shared out across a pool of processes, giving the
+#                      speedup), the endgame solver (checking the final scores it proves against
+#                      the baseline too), best_move on each board size (microseconds per move),
+#                      replaying a game archive and draw_chips (drawing onto a stand-in canvas, so
+#                      no display is needed).
+#                      The results are written to a JSON file and compared with the baseline,
+#                      anything that has slowed down by more than the tolerance is flagged (the
+#                      parallel search is only reported as it depends on the processors, and the
+#                      time per move on each board size is too changeable to be flagged).
+#                      e.g.  python Benchmark.py                   (run and compare)
+#                            python Benchmark.py --save-baseline   (run and make this the baseline)
+# Date Created       : 17Oct2026
+# Author             : A.S.Harrison
+# Amendment History  : Date         Author          Description
+#                      17Oct2026    A.S.Harrison    Created
+#                      17Oct2026    A.S.Harrison    Endgame solver benchmark.
+#                      17Oct2026    A.S.Harrison    Parallel search benchmark (see --workers).
+#                      17Oct2026    A.S.Harrison    Time per move of best_move on each board size.
+#                      17Oct2026    A.S.Harrison    Replaying a game archive (GameRecord.py).
+#                      17Oct2026    A.S.Harrison    Endgame position where the side to move passes.
+#                      17Oct2026    A.S.Harrison    Parallel search left out of the baseline.
+#                      17Oct2026    A.S.Harrison    Fixed moves per board size, not flagged.
+#--------------------------------------------------------------------------------------------------
+
+import os                                                               # For finding the baseline file
+import sys                                                              # Used when exitting the code
+import json                                                             # The results file format
+import time                                                             # For the timings
+import platform                                                         # To record what the benchmark ran on
+import argparse                                                         # For reading the command line
+import tempfile                                                         # Somewhere to put the archive
+import Bitboard                                                         # The bitboard engine
+import Search                                                           # The alpha-beta search
+import Endgame                                                          # The endgame solver
+import SelfPlay                                                         # For timing whole games
+import GameRecord                                                       # For timing the game archive
+from GameCore import *                                                  # The game rules and board constants
+
+# Define all the constants-------------------------------------------------------------------------
+BASELINE_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'benchmark_baseline.json')
+RESULTS_FILE = str('benchmark_results.json')
+TOLERANCE = float(0.25)                                                 # Flag anything more than 25% slower than the baseline
+PERFT_START_DEPTH = int(6)                                              # How deep to count from the starting position
+PERFT_POSITION_DEPTH = int(3)                                           # And from each of the stored positions
+SEARCH_DEPTH = int(4)                                                   # Depth for the search timings
+TIMING_RUNS = int(3)                                                    # Each timing is the best of this many runs (to cut out noise)
+BOARD_SIZES = (6, 8, 10, 12, 16)                                        # Board sizes for the time per move
+SIZE_MOVES = int(3000)                                                  # Moves timed on each board size (a few games is too few to compare)
+CHIP_LETTERS = {'-': NO_CHIP, 'X': BLACK_CHIP, 'O': WHITE_CHIP}         # How the stored positions are written down
+
+# Mid-game positions reached by random play (a row of 8 cells at a time, then whose turn it is)
+POSITIONS = (
+    ('------------XO-----XO-----OOXO-----XXX------XXX-----------------', 'O'),
+    ('----------O---O----OXO-----XXXX----OX-----OXX----OOOX-----OO----', 'O'),
+    ('----------X-------XX--X--XOXXX--XOXXX---OOOXX----OXX-----X-X----', 'O'),
+    ('---X----OOOX-X----XO-X---XXXXXXXX--XXO----OOOX-----O-X-----O-X--', 'O'),
+    ('--O------OOO----OXOOO----XXOXX---XOXXXX--XXOXXXXOX-OOX-----O-O--', 'O'),
+    ('---OOOX----OOXX-OOOOXXX-XOOOXXX--XOXXXXX-OXXXXXX--XX---X-X------', 'O'),
+    ('---XO--X---OO-X-XXXOOXXO-XXOOOXXXXXXOOO--XXXXOOOXXXXXOO-XXXXX-O-', 'O'),
+    ('--XO-XOXXXXOXXXXXXOOOXXXXXXOXX-XOXOXXX-XOXXOXOX-OXXXOXX--OX--OXO', 'O'),
+)
+
+# Positions near the end of the game for the endgame solver (written down the same way)
+ENDGAME_POSITIONS = (
+    ('XOOOOOO-XXOXOX-XX-XOOX-X---OOXXXXXOOOOXX-X-O-XXXOXXXXXXX-X-XXXXX', 'O'),
+    ('-XXXXX----XXXX--OOXXXX-XOX-XXXXXOXXXXXXXOOOOXXXXX-OXOX-X--OOOO-X', 'O'),
+    ('XXXXXXX-XXXXX---XXXXOO--XXXXO---XXOOOX--XXOOXXXXXXOOO--XOXXXXX-X', 'O'),
+    ('--OOOOOO---OOOOO-XXXOXOO--XOXXXOXXXXXXXXXXOXOX--XXXXXX--XXXXXXX-', 'X'), # Black has to pass
+)
+
+
+# Turn a stored position into a grid and the colour to move----------------------------------------
+def position_grid(tplPosition: tuple):
+    return [CHIP_LETTERS[c] for c in tplPosition[0]], CHIP_LETTERS[tplPosition[1]]
+
+
+# Run a function a few times and return its result and the quickest time---------------------------
+def timed(fnBenchmark, *args):
+    fltBest = None
+    for i in range(TIMING_RUNS):
+        fltStart = time.perf_counter()
+        result = fnBenchmark(*args)
+        fltElapsed = time.perf_counter() - fltStart
+        if fltBest is None or fltElapsed < fltBest: fltBest = fltElapsed
+    return result, max(fltBest, 1e-9)                                   # Never return zero (the times get divided into things)
+
+
+# Count the leaf positions to a depth using the bitboard engine------------------------------------
+# A pass counts as a move, and a finished game counts as a leaf however deep it is
+def perft_bitboard(intOwn: int, intOpp: int, intDepth: int, blnPassed: bool = False):
+    if intDepth == 0: return 1
+    intMoves = Bitboard.legal_moves(intOwn, intOpp)
+    if intMoves == 0:                                                   # We have to pass
+        if blnPassed: return 1                                          # Neither side can go so the game is over
+        return perft_bitboard(intOpp, intOwn, intDepth - 1, True)
+    intCount = int(0)
+    for intCell in Bitboard.cells(intMoves):                            # For each move
+        intFlips = Bitboard.flips(intOwn, intOpp, intCell)
+        intCount += perft_bitboard(intOpp & ~intFlips, intOwn | intFlips | (1 << intCell), intDepth - 1)
+    return intCount
+
+
+# Count the leaf positions to a depth using GameCore's list engine (the rays, not the bitboards)---
+# Uses make_move/unmake_move on a single game, so this also checks that moves are taken back properly
+def perft_grid(game: GameCore, intColor: int, intDepth: int, blnPassed: bool = False):
+    if intDepth == 0: return 1
+    lstMoves = game.legal_moves(intColor)
+    if len(lstMoves) == 0:                                              # We have to pass
+        if blnPassed: return 1                                          # Neither side can go so the game is over
+        return perft_grid(game, game.other_color(intColor), intDepth - 1, True)
+    intCount = int(0)
+    for intCell in lstMoves:                                            # For each move
+        lstFlips = game.make_move(intColor, intCell)
+        intCount += perft_grid(game, game.other_color(intColor), intDepth - 1)
+        game.unmake_move(intColor, intCell, lstFlips)                   # Take it back again
+    return intCount
+
+
+# A GameCore set up with a grid, using the list engine for everything (not the bitboards)----------
+def grid_game(lstGrid: list):
+    game = GameCore(0, False)
+    game.grid[:] = lstGrid
+    game.refresh_moves()
+    return game
+
+
+# Run perft on the starting position and every stored position-------------------------------------
+def run_perft(dictResults: dict, intStartDepth: int, intPositionDepth: int):
+    lstJobs = [('start', GameCore(0, False).grid, WHITE_CHIP, intStartDepth)] # White goes first
+    for i in range(len(POSITIONS)):
+        lstGrid, intColor = position_grid(POSITIONS[i])
+        lstJobs.append(('position%d' % (i + 1), lstGrid, intColor, intPositionDepth))
+
+    intNodes = intGridNodes = int(0)                                    # Totals for all the positions (one long timing is steadier
+    fltBitboard = fltGrid = float(0)                                    # than lots of little ones)
+    for strName, lstGrid, intColor, intDepth in lstJobs:
+        board = Bitboard.Bitboard.from_grid(lstGrid)
+        intOwn, intOpp = board.sides(intColor)
+        intCount, fltElapsed = timed(perft_bitboard, intOwn, intOpp, intDepth)
+        intNodes += intCount
+        fltBitboard += fltElapsed
+
+        game = grid_game(lstGrid)
+        intGridCount, fltElapsed = timed(perft_grid, game, intColor, intDepth)
+        if game.grid != lstGrid: intGridCount = -1                      # unmake_move didn't put everything back
+        intGridNodes += intGridCount
+        fltGrid += fltElapsed
+
+        dictResults['perft'][strName] = {'depth': intDepth, 'nodes': intCount, 'grid_nodes': intGridCount}
+    dictResults['timings']['perft_bitboard'] = {'value': intNodes / fltBitboard, 'unit': 'leaves/sec'}
+    dictResults['timings']['perft_grid'] = {'value': intGridNodes / fltGrid, 'unit': 'leaves/sec'}
+
+
+# Time finding all the moves (and their flips) in the stored positions-----------------------------
+def run_movegen(dictResults: dict, intRepeats: int):
+    lstBoards = []
+    for tplPosition in POSITIONS:
+        lstGrid, intColor = position_grid(tplPosition)
+        lstBoards.append((lstGrid, intColor, Bitboard.Bitboard.from_grid(lstGrid).sides(intColor)))
+    result, fltElapsed = timed(movegen_bitboard, lstBoards, intRepeats)
+    dictResults['timings']['movegen_bitboard'] = {'value': intRepeats * len(lstBoards) / fltElapsed, 'unit': 'positions/sec'}
+    result, fltElapsed = timed(movegen_grid, lstBoards, intRepeats)
+    dictResults['timings']['movegen_grid'] = {'value': intRepeats * len(lstBoards) / fltElapsed, 'unit': 'positions/sec'}
+
+
+# Find every move and its flips with the bitboards-------------------------------------------------
+def movegen_bitboard(lstBoards: list, intRepeats: int):
+    for r in range(intRepeats):
+        for lstGrid, intColor, (intOwn, intOpp) in lstBoards:
+            for intCell in Bitboard.cells(Bitboard.legal_moves(intOwn, intOpp)): Bitboard.flips(intOwn, intOpp, intCell)
+
+
+# Find every move and its flips the original way - try move_points on every empty cell-------------
+def movegen_grid(lstBoards: list, intRepeats: int):
+    game = GameCore(0, False)
+    for r in range(intRepeats):
+        for lstGrid, intColor, tplSides in lstBoards:
+            game.grid = lstGrid
+            for intCell in range(game.cells):
+                if lstGrid[intCell] == NO_CHIP: game.move_points(intColor, intCell)
+
+
+# Time whole games of best_move against itself-----------------------------------------------------
+def run_selfplay(dictResults: dict, intGames: int):
+    dictStats, fltElapsed = timed(SelfPlay.run, intGames, STRATEGY_GREEDY, STRATEGY_GREEDY, 1, 1)
+    dictResults['timings']['selfplay_greedy'] = {'value': dictStats['games'] / fltElapsed, 'unit': 'games/sec'}
+
+
+# Time best_move against itself on each board size, as microseconds per move-----------------------
+# (the larger boards should stay in the same class as 8x8 - the rays mean the work per cell is the same)
+def run_sizes(dictResults: dict, intMoves: int):
+    for intSize in BOARD_SIZES:
+        intMade, fltElapsed = timed(play_size, intSize, intMoves)
+        dictResults['timings']['move_us_%dx%d' % (intSize, intSize)] = {'value': 1000000 * fltElapsed / intMade, 'unit': 'us/move', 'lower_is_better': True, 'informational': True}
+
+
+# Play greedy games on one board size until intMoves moves have been made, returns the moves made--
+# Every size makes the same number of moves so they're all timed over the same amount of work
+def play_size(intSize: int, intMoves: int):
+    intMade = int(0)
+    intGame = int(0)
+    while intMade < intMoves:
+        game = GameCore(intGame, False, intSize)                        # The list engine, which works on every size
+        intColor = WHITE_CHIP
+        while intMade < intMoves and not game.finished():
+            intCell = game.best_move(intColor, False)
+            if intCell != -1:                                           # Unless it's a pass
+                game.make_move(intColor, intCell)
+                intMade += 1
+            intColor = game.other_color(intColor)
+        intGame += 1
+    return intMade
+
+
+# Save some games to an archive and time how quickly they can be replayed and analysed-------------
+def run_archive(dictResults: dict, intGames: int):
+    with tempfile.TemporaryDirectory() as strDir:
+        strArchive = os.path.join(strDir, 'benchmark.fca')
+        SelfPlay.run(intGames, STRATEGY_GREEDY, STRATEGY_GREEDY, 1, 1, strArchive = strArchive) # Games for it to replay (not timed)
+        dictStats, fltElapsed = timed(GameRecord.analyse, strArchive)
+    dictResults['timings']['archive_replay'] = {'value': dictStats['games'] / fltElapsed, 'unit': 'games/sec'}
+
+
+# Time the alpha-beta search on the stored positions-----------------------------------------------
+def run_search(dictResults: dict, intDepth: int):
+    intNodes, fltElapsed = timed(search_positions, intDepth)
+    dictResults['timings']['search_depth%d' % intDepth] = {'value': len(POSITIONS) / fltElapsed, 'unit': 'searches/sec'}
+    dictResults['timings']['search_nodes'] = {'value': intNodes / fltElapsed, 'unit': 'nodes/sec'}
+
+
+# Search each of the stored positions, returns the total number of nodes---------------------------
+def search_positions(intDepth: int):
+    intNodes = int(0)
+    for tplPosition in POSITIONS:
+        lstGrid, intColor = position_grid(tplPosition)
+        board = Bitboard.Bitboard.from_grid(lstGrid)
+        searcher = Search.Searcher(intDepth, 16)                        # A fresh table each time so the runs are independent
+        searcher.search(board.black, board.white, intColor)
+        intNodes += searcher.nodes
+    return intNodes
+
+
+# Time the parallel search on the stored positions and work out its speedup over one process-------
+# Each run gets a new pool, otherwise the later runs would find the positions in the processes'
+# transposition tables (search_positions uses a fresh table for each position too)
+def run_parallel(dictResults: dict, intDepth: int, intWorkers: int):
+    intNodes, fltSingle = timed(search_positions, intDepth)
+    fltElapsed = None
+    for r in range(TIMING_RUNS):
+        searcher = Search.ParallelSearcher(intWorkers)
+        searcher.warm_up()                                              # Get the processes started before timing anything
+        fltStart = time.perf_counter()
+        search_parallel(searcher, intDepth)
+        fltRun = time.perf_counter() - fltStart
+        searcher.shutdown()
+        if fltElapsed is None or fltRun < fltElapsed: fltElapsed = fltRun # The quickest run, the same as timed
+    dictResults['timings']['search_parallel%d' % intWorkers] = {'value': len(POSITIONS) / fltElapsed, 'unit': 'searches/sec', 'per_machine': True}
+    dictResults['timings']['parallel_speedup'] = {'value': fltSingle / fltElapsed, 'unit': 'x one process (%d processes, %d processors)' % (intWorkers, os.cpu_count() or 1), 'per_machine': True}
+
+
+# Search each of the stored positions with a parallel searcher, returns the total number of nodes--
+def search_parallel(searcher, intDepth: int):
+    intNodes = int(0)
+    for tplPosition in POSITIONS:
+        lstGrid, intColor = position_grid(tplPosition)
+        board = Bitboard.Bitboard.from_grid(lstGrid)
+        searcher.ranking = {}                                           # Start each position afresh, like search_positions
+        searcher.search(board.black, board.white, intColor, intDepth)
+        intNodes += searcher.nodes
+    return intNodes
+
+
+# Solve the stored endgame positions, recording the proven scores and timing the solver------------
+def run_endgame(dictResults: dict):
+    (intNodes, lstScores), fltElapsed = timed(solve_positions)
+    for i in range(len(ENDGAME_POSITIONS)):
+        lstGrid, intColor = position_grid(ENDGAME_POSITIONS[i])
+        dictResults['endgame']['position%d' % (i + 1)] = {'empties': lstGrid.count(NO_CHIP), 'score': lstScores[i]}
+    dictResults['timings']['endgame_solve'] = {'value': len(ENDGAME_POSITIONS) / fltElapsed, 'unit': 'solves/sec'}
+    dictResults['timings']['endgame_nodes'] = {'value': intNodes / fltElapsed, 'unit': 'nodes/sec'}
+
+
+# Solve each of the stored endgame positions, returns the total nodes and the proven scores--------
+def solve_positions():
+    intNodes = int(0)
+    lstScores = []
+    for tplPosition in ENDGAME_POSITIONS:
+        lstGrid, intColor = position_grid(tplPosition)
+        board = Bitboard.Bitboard.from_grid(lstGrid)
+        solver = Endgame.Solver()                                       # A fresh cache each time so the runs are independent
+        lstScores.append(solver.solve(board.black, board.white, intColor)[1])
+        intNodes += solver.nodes
+    return intNodes, lstScores
+
+
+# Stand-ins for the Tk window and canvas so draw_chips can be timed without a display--------------
+class StubWindow():
+    def update(me): pass
+    def after(me, intMS, *args): pass
+
+class StubCanvas():
+    def __init__(me): me.items = 0
+    def create_item(me, *args, **kwargs):
+        me.items += 1
+        return me.items
+    create_line = create_oval = create_rectangle = create_item
+    def itemconfigure(me, *args, **kwargs): pass
+    def coords(me, *args): pass
+    def tag_raise(me, *args): pass
+
+
+# Time draw_chips for every move of some games-----------------------------------------------------
+def run_render(dictResults: dict, intGames: int):
+    try:
+        import FlipChip                                                 # Needs tkinter to be installed (but not a display)
+    except ImportError:
+        dictResults['skipped'].append('render (tkinter is not installed)')
+        return
+    gui = FlipChip.FlipChip.__new__(FlipChip.FlipChip)                  # Skip __init__, which would open a window
+    gui.window = StubWindow()
+    gui.canvas = StubCanvas()
+    gui.game = GameCore(0)
+    gui.cell_size = int(FlipChip.SIZE_OF_BOARD / gui.game.columns)
+    gui.create_chips()
+    lstMoves = []                                                       # Play the games first so only the drawing gets timed
+    for g in range(intGames):
+        game = GameCore(g)
+        intColor = WHITE_CHIP
+        while not game.finished():
+            intCell = game.best_move(intColor, False)
+            if intCell != -1:                                           # Unless it's a pass
+                lstMoves.append((g, intColor, intCell))
+                game.make_move(intColor, intCell)
+            intColor = game.other_color(intColor)
+    result, fltElapsed = timed(render_moves, gui, lstMoves)
+    dictResults['timings']['render_draw_chips'] = {'value': len(lstMoves) / fltElapsed, 'unit': 'moves drawn/sec'}
+    dictResults['timings']['render_canvas_items'] = {'value': gui.canvas.items, 'unit': 'canvas items', 'lower_is_better': True}
+
+
+# Replay some moves on the GUI, drawing after each one---------------------------------------------
+def render_moves(gui, lstMoves: list):
+    intGame = int(-1)
+    for g, intColor, intCell in lstMoves:
+        if g != intGame:                                                # A new game, just like after finish
+            intGame = g
+            gui.game.reset(g)
+            gui.draw_chips()
+        lstFlips = gui.game.make_move(intColor, intCell)
+        gui.draw_chips([intCell] + lstFlips)                            # Just the changed chips, as after a move
+
+
+# Run all the benchmarks---------------------------------------------------------------------------
+def run(blnQuick: bool = False, intWorkers: int = Search.DEFAULT_WORKERS):
+    dictResults = {'python': platform.python_version(), 'machine': platform.machine(), 'processor': platform.processor(),
+                   'date': time.strftime('%Y-%m-%d %H:%M:%S'), 'perft': {}, 'endgame': {}, 'timings': {}, 'skipped': []}
+    if blnQuick:                                                        # A quick run for checking correctness
+        run_perft(dictResults, PERFT_START_DEPTH - 2, PERFT_POSITION_DEPTH - 1)
+        run_movegen(dictResults, 20)
+        run_selfplay(dictResults, 10)
+        run_search(dictResults, SEARCH_DEPTH - 1)
+        run_parallel(dictResults, SEARCH_DEPTH - 1, intWorkers)
+        run_endgame(dictResults)
+        run_sizes(dictResults, SIZE_MOVES // 10)
+        run_archive(dictResults, 20)
+        run_render(dictResults, 2)
+    else:
+        run_perft(dictResults, PERFT_START_DEPTH, PERFT_POSITION_DEPTH)
+        run_movegen(dictResults, 200)
+        run_selfplay(dictResults, 100)
+        run_search(dictResults, SEARCH_DEPTH)
+        run_parallel(dictResults, SEARCH_DEPTH, intWorkers)
+        run_endgame(dictResults)
+        run_sizes(dictResults, SIZE_MOVES)
+        run_archive(dictResults, 200)
+        run_render(dictResults, 10)
+    return dictResults
+
+
+# Compare a set of results with the baseline, returns a list of problems---------------------------
+# perft counts and endgame scores must match exactly (a difference means the move generation or
+# the solver is wrong), timings are only compared if the baseline has the same benchmark and they
+# don't depend on the number of processors. Informational timings get a ratio but are never flagged
+def compare(dictResults: dict, dictBaseline: dict, fltTolerance: float = TOLERANCE):
+    lstProblems = []
+    for strName, dictPerft in dictResults['perft'].items():
+        if dictPerft['nodes'] != dictPerft['grid_nodes']:               # The two engines disagree
+            lstProblems.append('perft %s: bitboard counted %d but the list engine counted %d' % (strName, dictPerft['nodes'], dictPerft['grid_nodes']))
+        dictOld = dictBaseline.get('perft', {}).get(strName)
+        if dictOld is not None and dictOld['depth'] == dictPerft['depth'] and dictOld['nodes'] != dictPerft['nodes']:
+            lstProblems.append('perft %s: %d nodes, the baseline has %d' % (strName, dictPerft['nodes'], dictOld['nodes']))
+    for strName, dictEndgame in dictResults['endgame'].items():
+        dictOld = dictBaseline.get('endgame', {}).get(strName)
+        if dictOld is not None and dictOld['empties'] == dictEndgame['empties'] and dictOld['score'] != dictEndgame['score']:
+            lstProblems.append('endgame %s: solved as %d, the baseline has %d' % (strName, dictEndgame['score'], dictOld['score']))
+    for strName, dictTiming in dictResults['timings'].items():
+        if dictTiming.get('per_machine'): continue                      # The parallel search depends on the processors and --workers
+        dictOld = dictBaseline.get('timings', {}).get(strName)
+        if dictOld is None or dictOld['value'] <= 0: continue           # Nothing to compare with
+        fltRatio = dictTiming['value'] / dictOld['value']
+        if dictTiming.get('lower_is_better'): fltRatio = 1 / max(fltRatio, 1e-9)
+        dictTiming['baseline_ratio'] = fltRatio
+        if fltRatio < 1 - fltTolerance and not dictTiming.get('informational'): # The time per move on each size varies too much to flag
+            lstProblems.append('%s: %.1f %s, the baseline has %.1f (%.0f%% worse)' % (strName, dictTiming['value'], dictTiming['unit'], dictOld['value'], 100 * (1 - fltRatio)))
+    return lstProblems
+
+
+# Return the results to save as the baseline-------------------------------------------------------
+# Leaves out the timings that depend on the processors and the ratios added by compare
+def baseline_results(dictResults: dict):
+    dictTimings = {}
+    for strName, dictTiming in dictResults['timings'].items():
+        if dictTiming.get('per_machine'): continue
+        dictTimings[strName] = {strKey: value for strKey, value in dictTiming.items() if strKey != 'baseline_ratio'}
+    return dict(dictResults, timings = dictTimings)
+
+
+# Print a set of results---------------------------------------------------------------------------
+def report(dictResults: dict, lstProblems: list):
+    for strName, dictPerft in dictResults['perft'].items():
+        print('perft %-10s depth %d : %d' % (strName, dictPerft['depth'], dictPerft['nodes']))
+    for strName, dictEndgame in dictResults['endgame'].items():
+        print('endgame %-10s %d empty : %+d' % (strName, dictEndgame['empties'], dictEndgame['score']))
+    for strName, dictTiming in dictResults['timings'].items():
+        strRatio = ''
+        if 'baseline_ratio' in dictTiming: strRatio = '  (x%.2f baseline)' % dictTiming['baseline_ratio']
+        print('%-28s %14.1f %s%s' % (strName, dictTiming['value'], dictTiming['unit'], strRatio))
+    for strSkipped in dictResults['skipped']: print('Skipped: ' + strSkipped)
+    for strProblem in lstProblems: print('REGRESSION: ' + strProblem)
+    if len(lstProblems) == 0: print('No regressions')
+
+
+# Read the command line----------------------------------------------------------------------------
+def parse_args(lstArgs: list = None):
+    parser = argparse.ArgumentParser(description = 'Benchmark the FlipChip engine')
+    parser.add_argument('--output', default = RESULTS_FILE, help = 'where to write the results (JSON)')
+    parser.add_argument('--baseline', default = BASELINE_FILE, help = 'the baseline to compare against (JSON)')
+    parser.add_argument('--save-baseline', action = 'store_true', help = 'write the results to the baseline file as well')
+    parser.add_argument('--tolerance', type = float, default = TOLERANCE, help = 'how much slower than the baseline is allowed (0.25 = 25%%)')
+    parser.add_argument('--workers', type = int, default = Search.DEFAULT_WORKERS, help = 'processes for the parallel search (default: one per processor)')
+    parser.add_argument('--quick', action = 'store_true', help = 'shallower perft and fewer repeats (timings are not compared)')
+    return parser.parse_args(lstArgs)
+
+
+
+
+# This is where code execution actually starts
+
+if __name__ == '__main__':
+    args = parse_args()
+    dictResults = run(args.quick, args.workers)
+    dictBaseline = {}
+    if os.path.exists(args.baseline) and not args.quick:                # Quick runs use different depths so can't be compared
+        with open(args.baseline) as f: dictBaseline = json.load(f)
+    lstProblems = compare(dictResults, dictBaseline, args.tolerance)
+    report(dictResults, lstProblems)
+    with open(args.output, 'w') as f: json.dump(dictResults, f, indent = 2)
+    if args.save_baseline:
+        with open(args.baseline, 'w') as f: json.dump(baseline_results(dictResults), f, indent = 2)
+    sys.exit(1 if lstProblems else 0)
@@ -0,0 +1,225 @@
+#--------------------------------------------------------------------------------------------------
+# Purpose            : A bitboard version of the FlipChip board
+#                      The board is held as two 64-bit integers (one for the black chips and one
+#                      for the white chips), bit n of each integer represents grid cell n.
+#                      Legal moves and flips are generated for all cells at once by shifting and
+#                      masking, rather than walking the grid a cell at a time like line_points.
+# Date Created       : 17Oct2026
+# Author             : A.S.Harrison
+# Amendment History  : Date         Author          Description
+#                      17Oct2026    A.S.Harrison    Created
+#                      17Oct2026    A.S.Harrison    legal_moves and flips have the shifts written out
+#                                                   in full (they're called millions of times by the
+#                                                   endgame solver).
+#--------------------------------------------------------------------------------------------------
+
+# Define all the constants-------------------------------------------------------------------------
+COLUMNS = int(8)                                                        # Bitboards only work for the standard 8x8 board
+ROWS = COLUMNS
+CELLS = int(COLUMNS * ROWS)
+
+NO_CHIP = int(0)                                                        # These must match the values used in FlipChip
+BLACK_CHIP = int(-1)
+WHITE_CHIP = int(+1)
+
+FULL_BOARD = int(0xFFFFFFFFFFFFFFFF)                                    # Every cell on the board
+NOT_WEST_EDGE = int(0xFEFEFEFEFEFEFEFE)                                 # Every cell apart from the left hand column
+NOT_EAST_EDGE = int(0x7F7F7F7F7F7F7F7F)                                 # Every cell apart from the right hand column
+EDGE_ROWS = int(0xFF000000000000FF)                                     # The top and bottom rows
+EDGE_COLS = int(0x8181818181818181)                                     # The left and right columns
+INNER_COLS = int(0x7E7E7E7E7E7E7E7E)                                    # Every cell apart from the left and right hand columns
+
+
+# Shift a set of cells one step in each of the eight directions------------------------------------
+# After shifting east (or west) any cells which wrapped around to the opposite edge of the board
+# are masked off, this is the bitboard equivalent of the row/column checks in line_points
+def shift_north(intBits: int):
+    return intBits >> 8                                                 # Up a row
+
+def shift_south(intBits: int):
+    return (intBits << 8) & FULL_BOARD                                  # Down a row (and drop anything that fell off the bottom)
+
+def shift_east(intBits: int):
+    return (intBits << 1) & NOT_WEST_EDGE & FULL_BOARD                  # Right a column (and drop anything that wrapped to the left hand column)
+
+def shift_west(intBits: int):
+    return (intBits >> 1) & NOT_EAST_EDGE                               # Left a column (and drop anything that wrapped to the right hand column)
+
+def shift_north_east(intBits: int):
+    return (intBits >> 7) & NOT_WEST_EDGE
+
+def shift_south_east(intBits: int):
+    return (intBits << 9) & NOT_WEST_EDGE & FULL_BOARD
+
+def shift_south_west(intBits: int):
+    return (intBits << 7) & NOT_EAST_EDGE & FULL_BOARD
+
+def shift_north_west(intBits: int):
+    return (intBits >> 9) & NOT_EAST_EDGE
+
+SHIFTS = (shift_north, shift_south, shift_east, shift_west,             # All eight directions, in the same order that
+          shift_north_east, shift_south_east, shift_south_west, shift_north_west)  # move_points checks them
+
+
+# Work out every legal move for the player owning intOwn (returned as a set of bits)---------------
+# This does the same as shifting with the SHIFTS functions but written out in full, because it is
+# called for every position the search looks at. Opposite directions are done together (a shift
+# left by step and a shift right by step), and rather than masking after every east/west shift
+# the opponent chips in the left and right hand columns are left out of the runs, since a run
+# going sideways can't carry on through them without wrapping around the edge of the board
+def legal_moves(intOwn: int, intOpp: int):
+    intEmpty = ~(intOwn | intOpp) & FULL_BOARD                          # The cells with no chip in them
+    intInner = intOpp & INNER_COLS                                      # Opponent chips a sideways or diagonal run can go through
+    intMoves = int(0)                                                   # Initialise the result
+    for intStep, intMid in ((8, intOpp), (1, intInner), (7, intInner), (9, intInner)): # North/south, east/west and the two diagonals
+        intRun = (intOwn << intStep) & intMid                           # Opponent chips next to one of our chips
+        intRun |= (intRun << intStep) & intMid                          # Extend the runs of opponent chips, a run
+        intRun |= (intRun << intStep) & intMid                          # can be at most six chips long
+        intRun |= (intRun << intStep) & intMid
+        intRun |= (intRun << intStep) & intMid
+        intRun |= (intRun << intStep) & intMid
+        intMoves |= intRun << intStep                                   # The cell at the end of a run (checked for being empty below)
+        intRun = (intOwn >> intStep) & intMid                           # And the same in the opposite direction
+        intRun |= (intRun >> intStep) & intMid
+        intRun |= (intRun >> intStep) & intMid
+        intRun |= (intRun >> intStep) & intMid
+        intRun |= (intRun >> intStep) & intMid
+        intRun |= (intRun >> intStep) & intMid
+        intMoves |= intRun >> intStep
+    return intMoves & intEmpty                                          # Return all the legal moves (an empty cell at the end of a run)
+
+
+# Work out which chips would be flipped by playing a single cell-----------------------------------
+# Like legal_moves the shifts are written out in full, and most directions stop straight away
+# because the next cell isn't an opponent chip
+def flips(intOwn: int, intOpp: int, intCell: int):
+    intFlips = int(0)                                                   # Initialise the result
+    intMove = 1 << intCell                                              # The bit for the cell being played
+    intInner = intOpp & INNER_COLS                                      # Opponent chips a sideways or diagonal run can go through
+    for intStep, intMid in ((8, intOpp), (1, intInner), (7, intInner), (9, intInner)): # For each pair of directions
+        intLine = int(0)                                                # The opponent chips found in this direction
+        intBits = intMove << intStep                                    # Move to the next cell
+        while intBits & intMid:                                         # While we are on an opponents chip
+            intLine |= intBits                                          # Add it to the line
+            intBits <<= intStep                                         # And move on
+        if intBits & intOwn: intFlips |= intLine                        # The line only flips if it ends in one of our chips
+        intLine = int(0)                                                # And the same in the opposite direction
+        intBits = intMove >> intStep
+        while intBits & intMid:
+            intLine |= intBits
+            intBits >>= intStep
+        if intBits & intOwn: intFlips |= intLine
+    return intFlips                                                     # Return all the chips that would be flipped
+
+
+# Return the cell numbers of the bits that are set, lowest first-----------------------------------
+def cells(intBits: int):
+    while intBits:                                                      # While there are bits left
+        intLow = intBits & -intBits                                     # Isolate the lowest bit
+        yield intLow.bit_length() - 1                                   # Return its cell number
+        intBits ^= intLow                                               # And clear it
+
+
+# This class holds a board as a pair of bitboards and mirrors the methods of FlipChip so that
+# either can be used to look for moves
+class Bitboard():
+
+    # Create a board, optionally with chips already on it------------------------------------------
+    def __init__(me, intBlack: int = 0, intWhite: int = 0):
+        me.black = int(intBlack)                                        # Black chips
+        me.white = int(intWhite)                                        # White chips
+
+
+    # Create a board from a FlipChip style grid list-----------------------------------------------
+    @classmethod
+    def from_grid(cls, lstGrid: list):
+        intBlack = int(0)
+        intWhite = int(0)
+        for i in range(CELLS):                                          # For each cell in the grid
+            if lstGrid[i] == BLACK_CHIP: intBlack |= 1 << i             # Set the bit for a black chip
+            if lstGrid[i] == WHITE_CHIP: intWhite |= 1 << i             # Set the bit for a white chip
+        return cls(intBlack, intWhite)
+
+
+    # Return the board as a FlipChip style grid list-----------------------------------------------
+    def to_grid(me):
+        return [me.cell(i) for i in range(CELLS)]
+
+
+    # Reset the board to starting positions (the same cells as FlipChip.reset)---------------------
+    def reset(me):
+        me.black = (1 << int(CELLS / 2 - COLUMNS / 2)) | (1 << int(CELLS / 2 + COLUMNS / 2 - 1))
+        me.white = (1 << int(CELLS / 2 - COLUMNS / 2 - 1)) | (1 << int(CELLS / 2 + COLUMNS / 2))
+
+
+    # Return the chip in a cell--------------------------------------------------------------------
+    def cell(me, intCell: int):
+        if me.black >> intCell & 1: return BLACK_CHIP
+        if me.white >> intCell & 1: return WHITE_CHIP
+        return NO_CHIP
+
+
+    # Return the bitboards as (own chips, opponents chips) for a colour----------------------------
+    def sides(me, intColor: int):
+        if intColor == BLACK_CHIP: return me.black, me.white
+        return me.white, me.black
+
+
+    # Return all the legal moves for a colour as a set of bits-------------------------------------
+    def legal_moves(me, intColor: int):
+        intOwn, intOpp = me.sides(intColor)
+        return legal_moves(intOwn, intOpp)
+
+
+    # Calculate how many chips will be flipped for a given cell/colour-----------------------------
+    def move_points(me, intColor: int, intCell: int):
+        if (me.black | me.white) >> intCell & 1: return 0               # An occupied cell can't be played
+        intOwn, intOpp = me.sides(intColor)
+        return flips(intOwn, intOpp, intCell).bit_count()               # Count the chips that would be flipped
+
+
+    # Work out the best move for a colour (same weighting and tie breaks as FlipChip.best_move)----
+    def best_move(me, intColor: int, blnAnyMove: bool, lstSequence: list = None):
+        intOwn, intOpp = me.sides(intColor)
+        intMoves = legal_moves(intOwn, intOpp)                          # Every legal move in one go
+        if intMoves == 0: return -1                                     # No moves available
+        if blnAnyMove == True: return (intMoves & -intMoves).bit_length() - 1  # Any move will do so return the first one
+
+        intBestCell = int(-1)                                           # The cell that results in the best move
+        intBestFlips = int(0)                                           # The best weighting
+        if lstSequence is None: lstSequence = range(CELLS)              # Default to evaluating the cells in order
+        for intCell in lstSequence:                                     # For each cell, in the order the computer evaluates them
+            intBit = 1 << intCell
+            if intMoves & intBit:                                       # If it is a legal move
+                intFlips = flips(intOwn, intOpp, intCell).bit_count()   # See how many chips would be flipped
+                if intBit & EDGE_ROWS: intFlips += 256                  # Weight the top and bottom rows heavily
+                if intBit & EDGE_COLS: intFlips += 256                  # And the left and right columns (corners get both)
+                if intFlips > intBestFlips:                             # If this is the best move we have found so far
+                    intBestCell = intCell                               # Remember its cell location
+                    intBestFlips = intFlips                             # And remember its weighting
+        return intBestCell                                              # Return the cell with the best move
+
+
+    # Place a chip and do all the flipping, returns the flipped chips as a set of bits-------------
+    def make_move(me, intColor: int, intCell: int):
+        intOwn, intOpp = me.sides(intColor)
+        intFlips = flips(intOwn, intOpp, intCell)                       # Work out all the flips at once
+        intOwn |= intFlips | (1 << intCell)                             # Plant the chip and take the flipped chips
+        intOpp &= ~intFlips                                             # The opponent loses the flipped chips
+        if intColor == BLACK_CHIP: me.black, me.white = intOwn, intOpp
+        else: me.white, me.black = intOwn, intOpp
+        return intFlips
+
+
+    # Count up all the chips of a specifed colour (i.e. the player's score)------------------------
+    def score(me, intPlayer: int):
+        if intPlayer == BLACK_CHIP: return me.black.bit_count()
+        if intPlayer == WHITE_CHIP: return me.white.bit_count()
+        return CELLS - (me.black | me.white).bit_count()                # Number of empty cells
+
+
+    # Is the game over?----------------------------------------------------------------------------
+    def finished(me):
+        if legal_moves(me.white, me.black): return False                # If there's a white move available then we've not finished
+        if legal_moves(me.black, me.white): return False                # If there's a black move available then we've not finished
+        return True                                                     # Otherwise the game is over
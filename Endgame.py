@@ -0,0 +1,261 @@
+#--------------------------------------------------------------------------------------------------
+# Purpose            : Perfect play for the end of the game
+#                      Once there are only a few empty cells left the whole of the rest of the game
+#                      can be searched, so rather than estimating how good a position is the solver
+#                      works out the final chip difference with best play from both sides. It is a
+#                      negamax search with alpha-beta pruning like Search.py, but the moves are
+#                      ordered to finish the search as quickly as possible: moves which leave the
+#                      opponent with the fewest replies go first (fastest-first), and near the very
+#                      end moves into regions of the board with an odd number of empty cells go
+#                      first (parity). Solved positions are kept in a cache which forgets the least
+#                      recently used ones when it gets full.
+# Date Created       : 17Oct2026
+# Author             : A.S.Harrison
+# Amendment History  : Date         Author          Description
+#                      17Oct2026    A.S.Harrison    Created
+#                      17Oct2026    A.S.Harrison    A position where the side to move has to pass is
+#                                                   solved from the opponent's reply, not scored as 0.
+#--------------------------------------------------------------------------------------------------
+
+import time                                                             # For keeping to the time budget
+from collections import OrderedDict                                     # For the least recently used cache
+import Bitboard                                                         # Bitboard move generation
+import Search                                                           # For SearchTimeout and the normal search (if solving takes too long)
+
+# Define all the constants-------------------------------------------------------------------------
+CELLS = Bitboard.CELLS
+BLACK_CHIP = Bitboard.BLACK_CHIP
+WHITE_CHIP = Bitboard.WHITE_CHIP
+
+DEFAULT_EMPTIES = int(14)                                               # Solve the game once there are this many empty cells or fewer
+DEFAULT_CACHE_SIZE = int(1 << 18)                                       # The most solved positions the cache holds
+DEFAULT_SECONDS = float(2.0)                                            # Give up solving after this long (see timed_solve)
+SHALLOW_EMPTIES = int(6)                                                # Below this many empty cells use the simpler (uncached, parity only) search
+CLOCK_NODES = Search.CLOCK_NODES                                        # Look at the clock every 1024 positions
+MAX_SCORE = int(CELLS)                                                  # Nobody can win by more than every cell on the board
+
+CORNERS = int(0x8100000000000081)                                       # Always worth trying first
+QUADRANTS = (int(0x000000000F0F0F0F), int(0x00000000F0F0F0F0),          # The four 4x4 corners of the board, the empty cells
+             int(0x0F0F0F0F00000000), int(0xF0F0F0F000000000))          # in each one tend to get filled up separately
+
+
+# Return the number of empty cells on a board------------------------------------------------------
+def empties(intBlack: int, intWhite: int):
+    return CELLS - (intBlack | intWhite).bit_count()
+
+
+# Work out the final chip difference for the player owning intOwn----------------------------------
+def final_score(intOwn: int, intOpp: int):
+    return intOwn.bit_count() - intOpp.bit_count()                      # The same as counting the chips at the end of a game
+
+
+# Return the empty cells which are in quadrants with an odd number of empty cells------------------
+def odd_empties(intEmpty: int):
+    intOdd = int(0)
+    for intQuadrant in QUADRANTS:
+        if (intEmpty & intQuadrant).bit_count() & 1: intOdd |= intEmpty & intQuadrant
+    return intOdd
+
+
+# Turn a proven score into something to show the player--------------------------------------------
+def describe(intScore: int, strColor: str = 'Black'):
+    if intScore > 0: return strColor + ' wins by ' + str(intScore)      # The score is from that colour's point of view
+    if intScore < 0: return strColor + ' loses by ' + str(-intScore)
+    return 'It\'s a tie'
+
+
+# The solver keeps its cache between moves so later positions are often already solved-------------
+class Solver():
+
+    def __init__(me, intCacheSize: int = DEFAULT_CACHE_SIZE):
+        me.cache_size = int(intCacheSize)                               # How many positions to remember
+        me.cache = OrderedDict()                                        # (own, opp) -> (lowest score, highest score, best move), least recently used first
+        me.nodes = int(0)                                               # Positions visited in the last solve
+        me.hits = int(0)                                                # Statistics
+        me.deadline = None                                              # perf_counter time to give up by (None means no limit)
+
+
+    # Find the best move for a colour and the final score it leads to------------------------------
+    # Returns (cell, score) where score is the chip difference at the end of the game from intColor's
+    # point of view with perfect play (a cell of -1 if there's no move). fltSeconds limits the time
+    # taken, if it runs out a SearchTimeout is raised
+    def solve(me, intBlack: int, intWhite: int, intColor: int, fltSeconds: float = None):
+        if intColor == BLACK_CHIP: intOwn, intOpp = intBlack, intWhite
+        else: intOwn, intOpp = intWhite, intBlack
+        me.nodes = 0
+        me.deadline = None if fltSeconds is None else time.perf_counter() + fltSeconds
+        try:
+            return me.root(intOwn, intOpp)
+        finally:
+            me.deadline = None
+
+
+    # Search the moves at the root, remembering which move was best--------------------------------
+    def root(me, intOwn: int, intOpp: int):
+        intMoves = Bitboard.legal_moves(intOwn, intOpp)
+        intEmpty = ~(intOwn | intOpp) & Bitboard.FULL_BOARD
+        if intMoves == 0: return -1, -me.negamax(intOpp, intOwn, -MAX_SCORE - 1, MAX_SCORE + 1, intEmpty, True) # Nothing to play, so solve the opponent's reply to the pass
+        intBestCell = int(-1)
+        intAlpha = -MAX_SCORE - 1
+        for intCell, intFlips in me.ordered_moves(intOwn, intOpp, intMoves, intEmpty, me.best_cell(intOwn, intOpp)):
+            intNewOwn = intOpp & ~intFlips                              # The position after the move (from the opponent's side)
+            intNewOpp = intOwn | intFlips | (1 << intCell)
+            intNewEmpty = intEmpty ^ (1 << intCell)
+            if intBestCell == -1:                                       # The first move gets the full window
+                intValue = -me.negamax(intNewOwn, intNewOpp, -MAX_SCORE - 1, MAX_SCORE + 1, intNewEmpty, False)
+            else:                                                       # The rest just have to show they're better
+                intValue = -me.negamax(intNewOwn, intNewOpp, -intAlpha - 1, -intAlpha, intNewEmpty, False)
+                if intValue > intAlpha: intValue = -me.negamax(intNewOwn, intNewOpp, -MAX_SCORE - 1, -intAlpha, intNewEmpty, False)
+            if intValue > intAlpha:                                     # Best move so far
+                intAlpha = intValue
+                intBestCell = intCell
+        return intBestCell, intAlpha
+
+
+    # Negamax with alpha-beta pruning, returns the final chip difference for the player owning intOwn
+    # After the first move the others are searched with a null window (alpha, alpha + 1), which only
+    # finds out whether they're better than the best so far and is much quicker when they aren't
+    def negamax(me, intOwn: int, intOpp: int, intAlpha: int, intBeta: int, intEmpty: int, blnPassed: bool):
+        if intEmpty.bit_count() < SHALLOW_EMPTIES: return me.shallow(intOwn, intOpp, intAlpha, intBeta, intEmpty, blnPassed) # Near the end
+        me.nodes += 1
+        if me.deadline is not None and me.nodes & CLOCK_NODES == 0:     # Every so often check the clock
+            if time.perf_counter() > me.deadline: raise Search.SearchTimeout()
+
+        tplKey = (intOwn, intOpp)
+        tplBounds = me.cache.get(tplKey)
+        intFirst = int(-1)                                              # The best move last time we were here
+        if tplBounds is not None:                                       # We've solved (or partly solved) this position before
+            me.hits += 1
+            me.cache.move_to_end(tplKey)                                # It's been used so it's the last to be forgotten
+            intLower, intUpper, intFirst = tplBounds
+            if intLower >= intBeta: return intLower
+            if intUpper <= intAlpha: return intUpper
+            if intLower == intUpper: return intLower
+            if intLower > intAlpha: intAlpha = intLower                 # Narrow the window to what we already know
+            if intUpper < intBeta: intBeta = intUpper
+        intAlphaIn, intBetaIn = intAlpha, intBeta                       # Needed to decide what sort of result we've found
+
+        intMoves = Bitboard.legal_moves(intOwn, intOpp)
+        if intMoves == 0:                                               # We have to pass
+            if blnPassed: return final_score(intOwn, intOpp)            # And so did the opponent, so the game is over
+            return -me.negamax(intOpp, intOwn, -intBeta, -intAlpha, intEmpty, True)
+
+        intBest = -MAX_SCORE - 1
+        intBestCell = int(-1)
+        for intCell, intFlips in me.ordered_moves(intOwn, intOpp, intMoves, intEmpty, intFirst): # For each move, quickest to solve first
+            intNewOwn = intOpp & ~intFlips                              # The position after the move (from the opponent's side)
+            intNewOpp = intOwn | intFlips | (1 << intCell)
+            intNewEmpty = intEmpty ^ (1 << intCell)
+            if intBest == -MAX_SCORE - 1:                               # The first move gets the full window
+                intValue = -me.negamax(intNewOwn, intNewOpp, -intBeta, -intAlpha, intNewEmpty, False)
+            else:
+                intValue = -me.negamax(intNewOwn, intNewOpp, -intAlpha - 1, -intAlpha, intNewEmpty, False) # Is it any better?
+                if intAlpha < intValue < intBeta:                       # It is, so find out by how much
+                    intValue = -me.negamax(intNewOwn, intNewOpp, -intBeta, -intAlpha, intNewEmpty, False)
+            if intValue > intBest:
+                intBest = intValue
+                intBestCell = intCell
+                if intValue > intAlpha:
+                    intAlpha = intValue
+                    if intAlpha >= intBeta: break                       # The opponent won't allow this line so stop looking
+
+        me.store(tplKey, intBest, intAlphaIn, intBetaIn, intBestCell)
+        return intBest
+
+
+    # Negamax for the last few empty cells---------------------------------------------------------
+    # With so few cells left it's quicker to try each empty cell than to generate the legal moves,
+    # and quicker to solve positions again than to look them up. The cells are tried in parity order
+    def shallow(me, intOwn: int, intOpp: int, intAlpha: int, intBeta: int, intEmpty: int, blnPassed: bool):
+        me.nodes += 1
+        if me.deadline is not None and me.nodes & CLOCK_NODES == 0:     # Every so often check the clock
+            if time.perf_counter() > me.deadline: raise Search.SearchTimeout()
+        if intEmpty & (intEmpty - 1) == 0: return me.last_move(intOwn, intOpp, intEmpty) # Only one cell left, so no searching needed
+
+        intOdd = odd_empties(intEmpty)
+        intBest = -MAX_SCORE - 1
+        for intCell in [*Bitboard.cells(intOdd), *Bitboard.cells(intEmpty & ~intOdd)]: # Odd quadrants first
+            intFlips = Bitboard.flips(intOwn, intOpp, intCell)
+            if intFlips == 0: continue                                  # Not a legal move
+            intValue = -me.shallow(intOpp & ~intFlips, intOwn | intFlips | (1 << intCell), -intBeta, -intAlpha, intEmpty ^ (1 << intCell), False)
+            if intValue > intBest:
+                intBest = intValue
+                if intValue > intAlpha:
+                    intAlpha = intValue
+                    if intAlpha >= intBeta: break                       # The opponent won't allow this line so stop looking
+
+        if intBest == -MAX_SCORE - 1:                                   # We have to pass
+            if blnPassed: return final_score(intOwn, intOpp)            # And so did the opponent, so the game is over
+            return -me.shallow(intOpp, intOwn, -intBeta, -intAlpha, intEmpty, True)
+        return intBest
+
+
+    # Play the last empty cell (whoever can) and score the end of the game-------------------------
+    def last_move(me, intOwn: int, intOpp: int, intEmpty: int):
+        if intEmpty == 0: return final_score(intOwn, intOpp)            # The board is already full
+        intCell = intEmpty.bit_length() - 1                             # The only empty cell
+        intFlips = Bitboard.flips(intOwn, intOpp, intCell)
+        if intFlips: return final_score(intOwn | intFlips | intEmpty, intOpp & ~intFlips) # We can play it
+        intFlips = Bitboard.flips(intOpp, intOwn, intCell)
+        if intFlips: return final_score(intOwn & ~intFlips, intOpp | intFlips | intEmpty) # Or the opponent can
+        return final_score(intOwn, intOpp)                              # Or it stays empty
+
+
+    # Return the moves in the order they should be searched, as (cell, flips) pairs----------------
+    # The moves that leave the opponent with the fewest replies are tried first, since the best
+    # move is usually one of them and they have the smallest trees below them. Corners get a bonus
+    # as they are hardly ever wrong, and parity breaks ties: a move into a quadrant with an odd
+    # number of empty cells means we're likely to get the last move there too
+    def ordered_moves(me, intOwn: int, intOpp: int, intMoves: int, intEmpty: int, intFirst: int = -1):
+        intOdd = odd_empties(intEmpty)
+        lstMoves = []
+        for intCell in Bitboard.cells(intMoves):
+            intFlips = Bitboard.flips(intOwn, intOpp, intCell)
+            intReplies = Bitboard.legal_moves(intOpp & ~intFlips, intOwn | intFlips | (1 << intCell)).bit_count() # The opponent's mobility afterwards
+            if CORNERS >> intCell & 1: intReplies -= 2
+            if intOdd >> intCell & 1: intReplies -= 1
+            if intCell == intFirst: intReplies -= CELLS                 # The best move from the cache goes before everything
+            lstMoves.append((intReplies, intCell, intFlips))
+        lstMoves.sort()
+        return [(intCell, intFlips) for intReplies, intCell, intFlips in lstMoves]
+
+
+    # Remember what we found out about a position--------------------------------------------------
+    def store(me, tplKey: tuple, intBest: int, intAlpha: int, intBeta: int, intBestCell: int):
+        intLower, intUpper, intOldCell = me.cache.pop(tplKey, (-MAX_SCORE, MAX_SCORE, -1)) # Add to anything we already knew
+        if intBest <= intAlpha: intUpper = min(intUpper, intBest)       # No move beat alpha, so this is the most it's worth
+        elif intBest >= intBeta: intLower = max(intLower, intBest)      # A beta cut-off, so this is the least it's worth
+        else: intLower = intUpper = intBest                             # Exact
+        if intBest <= intAlpha: intBestCell = intOldCell                # (and after a fail low every move looked as bad, so keep the old best move)
+        me.cache[tplKey] = (intLower, intUpper, intBestCell)            # Goes on the end as the most recently used
+        if len(me.cache) > me.cache_size: me.cache.popitem(last = False) # Forget the least recently used position
+
+
+    # Return the best move the cache has for a position (-1 if it hasn't got one)------------------
+    def best_cell(me, intOwn: int, intOpp: int):
+        tplBounds = me.cache.get((intOwn, intOpp))
+        if tplBounds is None: return -1
+        return tplBounds[2]
+
+
+    # Empty the cache------------------------------------------------------------------------------
+    def clear(me):
+        me.cache.clear()
+
+
+# Globals------------------------------------------------------------------------------------------
+_solver = None                                                          # The solver used by timed_solve (one per process)
+
+
+# Solve a position, this is what the GUI runs in its background process in the endgame-------------
+# Returns (cell, score, solved). If the position can't be solved in fltSeconds then the normal
+# iterative deepening search is used instead (for another fltSearchSeconds) and solved is False
+def timed_solve(intBlack: int, intWhite: int, intColor: int, fltSeconds: float = DEFAULT_SECONDS, fltSearchSeconds: float = Search.DEFAULT_SECONDS):
+    global _solver
+    if _solver is None: _solver = Solver()
+    try:
+        intCell, intScore = _solver.solve(intBlack, intWhite, intColor, fltSeconds)
+        return intCell, intScore, True
+    except Search.SearchTimeout:                                        # Too many empty cells to solve in time
+        intCell, intValue = Search.timed_search(intBlack, intWhite, intColor, fltSearchSeconds)
+        return intCell, intValue, False
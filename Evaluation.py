@@ -0,0 +1,257 @@
+#--------------------------------------------------------------------------------------------------
+# Purpose            : Pattern based evaluation of a position
+#                      The board is looked at as a set of lines and blocks of cells (the edges, the
+#                      second rows in, the 3x3 corners and the two long diagonals). The chips in
+#                      each one are read as a base-3 number (empty 0, black 1, white 2) which is
+#                      used to look up a value in a table, so evaluating a position is just one
+#                      table lookup per pattern. The numbers are kept up to date as chips are placed
+#                      and flipped rather than being worked out again for every position.
+#                      The tables are learnt from self-play games and saved in a small binary file:
+#                      e.g.  python Evaluation.py --games 20000    (trains and writes patterns.bin)
+#                      No patterns.bin is shipped, so until the tables have been trained the search
+#                      uses the square weights and mobility in Search.evaluate and nothing here is
+#                      used (default_tables returns None).
+# Date Created       : 17Oct2026
+# Author             : A.S.Harrison
+# Amendment History  : Date         Author          Description
+#                      17Oct2026    A.S.Harrison    Created
+#                      17Oct2026    A.S.Harrison    Made it clear the tables are off until trained.
+#                      17Oct2026    A.S.Harrison    A cut short pattern file isn't loaded.
+#--------------------------------------------------------------------------------------------------
+
+import os                                                               # For finding the tables file
+import sys                                                              # Used when exitting the code
+import time                                                             # For reporting how long training took
+import array                                                            # The tables are arrays of 16-bit numbers
+import random                                                           # For the training games
+import struct                                                           # For the tables file header
+import argparse                                                         # For reading the command line
+import Bitboard                                                         # For the board constants
+
+# Define all the constants-------------------------------------------------------------------------
+COLUMNS = Bitboard.COLUMNS                                              # Patterns only work on the standard 8x8 board
+CELLS = Bitboard.CELLS
+NO_CHIP = Bitboard.NO_CHIP
+BLACK_CHIP = Bitboard.BLACK_CHIP
+WHITE_CHIP = Bitboard.WHITE_CHIP
+
+PATTERN_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'patterns.bin')
+FILE_MAGIC = b'FCPT'                                                    # The first four bytes of a tables file
+FILE_VERSION = int(1)
+STAGES = int(4)                                                         # Separate tables for each part of the game (by chips on the board)
+DISC_POINTS = int(10)                                                   # What a chip is worth in the tables when training
+TABLE_LIMIT = int(2000)                                                 # Largest value in a table (so the total never looks like a win to the search)
+DIGITS = {NO_CHIP: 0, BLACK_CHIP: 1, WHITE_CHIP: 2}                     # The base-3 digit for each chip
+
+# Rotate a cell a quarter turn clockwise
+def _rotate(intCell: int):
+    return (intCell % COLUMNS) * COLUMNS + (COLUMNS - 1 - intCell // COLUMNS)
+
+# Return a pattern and its three rotations
+def _rotations(lstCells: list, intCount: int = 4):
+    lstResult = [list(lstCells)]
+    for i in range(intCount - 1): lstResult.append([_rotate(c) for c in lstResult[-1]])
+    return lstResult
+
+# The patterns - one list of cells per pattern, grouped by type. Patterns of the same type share
+# a table, and the first cell in each is the lowest digit of its number
+PATTERN_TYPES = (
+    ('edge', _rotations([0, 1, 2, 3, 4, 5, 6, 7])),                     # Each edge
+    ('row2', _rotations([8, 9, 10, 11, 12, 13, 14, 15])),               # The row in from each edge
+    ('corner', _rotations([0, 1, 2, 8, 9, 10, 16, 17, 18])),            # The 3x3 block in each corner
+    ('diagonal', _rotations([0, 9, 18, 27, 36, 45, 54, 63], 2)),        # The two long diagonals
+)
+
+PATTERNS = []                                                           # Every pattern's cells
+PATTERN_OFFSETS = []                                                    # Where each pattern's table starts within a stage's table
+TABLE_SIZE = int(0)                                                     # Size of one stage's table (all the types end to end)
+for _strType, _lstPatterns in PATTERN_TYPES:
+    for _lstCells in _lstPatterns:
+        PATTERNS.append(_lstCells)
+        PATTERN_OFFSETS.append(TABLE_SIZE)
+    TABLE_SIZE += 3 ** len(_lstPatterns[0])
+
+CELL_PATTERNS = [[] for i in range(CELLS)]                              # For each cell, the (pattern, power of 3) it's part of
+for _p in range(len(PATTERNS)):
+    for _k in range(len(PATTERNS[_p])): CELL_PATTERNS[PATTERNS[_p][_k]].append((_p, 3 ** _k))
+
+
+# Work out which stage of the game a position is in from the number of chips on the board----------
+def stage(intChips: int):
+    return min(STAGES - 1, max(0, (intChips - 4) * STAGES // (CELLS - 3)))
+
+
+# Work out the pattern numbers for a grid----------------------------------------------------------
+def grid_indexes(lstGrid: list):
+    return [sum(DIGITS[lstGrid[c]] * 3 ** k for k, c in enumerate(lstCells)) for lstCells in PATTERNS]
+
+
+# Work out the pattern numbers for a pair of bitboards---------------------------------------------
+def bits_indexes(intBlack: int, intWhite: int):
+    return [sum((intBlack >> c & 1 | (intWhite >> c & 1) << 1) * 3 ** k for k, c in enumerate(lstCells)) for lstCells in PATTERNS]
+
+
+# The value tables, one array per stage, values are from black's point of view---------------------
+class PatternTables():
+
+    def __init__(me, lstValues: list = None):
+        if lstValues is None: lstValues = [array.array('h', bytes(2 * TABLE_SIZE)) for i in range(STAGES)]
+        me.values = lstValues
+
+
+    # Load tables from a file----------------------------------------------------------------------
+    @classmethod
+    def load(cls, strPath: str = PATTERN_FILE):
+        with open(strPath, 'rb') as f:
+            bytHeader = f.read(12)
+            if len(bytHeader) != 12: raise ValueError(strPath + " is not a FlipChip pattern file (or is for a different version)")
+            strMagic, intVersion, intStages, intSize = struct.unpack('<4sHHI', bytHeader)
+            if strMagic != FILE_MAGIC or intVersion != FILE_VERSION or intStages != STAGES or intSize != TABLE_SIZE:
+                raise ValueError(strPath + " is not a FlipChip pattern file (or is for a different version)")
+            lstValues = []
+            for i in range(STAGES):
+                bytValues = f.read(2 * TABLE_SIZE)
+                if len(bytValues) != 2 * TABLE_SIZE:                    # The file has been cut short, so the lookups would run off the end of the table
+                    raise ValueError(strPath + " is not a FlipChip pattern file (stage " + str(i) + " is incomplete)")
+                values = array.array('h')
+                values.frombytes(bytValues)
+                if sys.byteorder == 'big': values.byteswap()            # The file is always little-endian
+                lstValues.append(values)
+        return cls(lstValues)
+
+
+    # Save the tables to a file--------------------------------------------------------------------
+    def save(me, strPath: str = PATTERN_FILE):
+        with open(strPath, 'wb') as f:
+            f.write(struct.pack('<4sHHI', FILE_MAGIC, FILE_VERSION, STAGES, TABLE_SIZE))
+            for values in me.values:
+                values = array.array('h', values)
+                if sys.byteorder == 'big': values.byteswap()
+                f.write(values.tobytes())
+
+
+# The pattern numbers for one position, kept up to date as moves are made and taken back-----------
+class PatternState():
+
+    def __init__(me, tables: PatternTables):
+        me.tables = tables
+        me.indexes = [0] * len(PATTERNS)                                # The number for each pattern
+        me.chips = int(0)                                               # Chips on the board (for the stage)
+
+
+    # Set the position from a grid-----------------------------------------------------------------
+    def set_grid(me, lstGrid: list):
+        me.indexes = grid_indexes(lstGrid)
+        me.chips = CELLS - lstGrid.count(NO_CHIP)
+
+
+    # Set the position from a pair of bitboards----------------------------------------------------
+    def set_bits(me, intBlack: int, intWhite: int):
+        me.indexes = bits_indexes(intBlack, intWhite)
+        me.chips = (intBlack | intWhite).bit_count()
+
+
+    # Place a chip and flip some chips-------------------------------------------------------------
+    def place(me, intColor: int, intCell: int, lstFlips):
+        lstIndexes = me.indexes
+        for p, intPower in CELL_PATTERNS[intCell]: lstIndexes[p] += DIGITS[intColor] * intPower # The new chip
+        intDelta = DIGITS[intColor] - DIGITS[-intColor]                 # A flip changes the digit from the other colour to this one
+        for c in lstFlips:
+            for p, intPower in CELL_PATTERNS[c]: lstIndexes[p] += intDelta * intPower
+        me.chips += 1
+
+
+    # Take back a move made by place---------------------------------------------------------------
+    def unplace(me, intColor: int, intCell: int, lstFlips):
+        lstIndexes = me.indexes
+        for p, intPower in CELL_PATTERNS[intCell]: lstIndexes[p] -= DIGITS[intColor] * intPower
+        intDelta = DIGITS[intColor] - DIGITS[-intColor]
+        for c in lstFlips:
+            for p, intPower in CELL_PATTERNS[c]: lstIndexes[p] -= intDelta * intPower
+        me.chips -= 1
+
+
+    # The value of the position for a colour (one table lookup per pattern)------------------------
+    def value(me, intColor: int):
+        values = me.tables.values[stage(me.chips)]
+        intTotal = sum(values[o + i] for o, i in zip(PATTERN_OFFSETS, me.indexes))
+        if intColor == BLACK_CHIP: return intTotal
+        return -intTotal
+
+
+# Globals------------------------------------------------------------------------------------------
+_default_tables = None                                                  # Loaded the first time default_tables is called
+
+
+# The tables the computer uses - patterns.bin if it's been trained, None otherwise-----------------
+# None is what you get out of the box (no tables are shipped) and it turns the pattern evaluation off
+def default_tables():
+    global _default_tables
+    if _default_tables is None and os.path.exists(PATTERN_FILE):
+        _default_tables = PatternTables.load(PATTERN_FILE)
+    return _default_tables
+
+
+# Play some self-play games and collect the positions with the final result------------------------
+# The players mostly play best_move but sometimes play at random (fltRandom of the time) so that
+# the games aren't all the same. Returns a list of (stage, pattern numbers, black - white chips)
+def training_positions(intGames: int, fltRandom: float = 0.2, intSeed: int = None):
+    from GameCore import GameCore, STRATEGY_RANDOM                      # Imported here as GameCore imports this module
+    rnd = random.Random(intSeed)
+    lstPositions = []
+    for g in range(intGames):
+        game = GameCore(rnd.getrandbits(32))
+        lstGame = []
+        intColor = WHITE_CHIP                                           # White goes first
+        while not game.finished():
+            if rnd.random() < fltRandom: intCell = game.choose_move(intColor, STRATEGY_RANDOM)
+            else: intCell = game.best_move(intColor, False)
+            if intCell != -1:
+                game.make_move(intColor, intCell)
+                lstGame.append((stage(CELLS - game.grid.count(NO_CHIP)), grid_indexes(game.grid)))
+            intColor = -intColor
+        intResult = game.score(BLACK_CHIP) - game.score(WHITE_CHIP)     # The final chip difference
+        lstPositions.extend((intStage, lstIndexes, intResult) for intStage, lstIndexes in lstGame)
+    return lstPositions
+
+
+# Fit the tables to some positions by stochastic gradient descent----------------------------------
+def fit(lstPositions: list, intEpochs: int = 10, fltRate: float = 0.01, intSeed: int = None):
+    rnd = random.Random(intSeed)
+    lstValues = [[0.0] * TABLE_SIZE for i in range(STAGES)]             # Train with floats, they get rounded at the end
+    lstOrder = list(range(len(lstPositions)))
+    for e in range(intEpochs):
+        rnd.shuffle(lstOrder)
+        for n in lstOrder:
+            intStage, lstIndexes, intResult = lstPositions[n]
+            values = lstValues[intStage]
+            lstSlots = [o + i for o, i in zip(PATTERN_OFFSETS, lstIndexes)]
+            fltError = intResult * DISC_POINTS - sum(values[s] for s in lstSlots)
+            for s in lstSlots: values[s] += fltRate * fltError          # Nudge every pattern towards the result
+    return PatternTables([array.array('h', [max(-TABLE_LIMIT, min(TABLE_LIMIT, int(round(v)))) for v in values]) for values in lstValues])
+
+
+# Read the command line----------------------------------------------------------------------------
+def parse_args(lstArgs: list = None):
+    parser = argparse.ArgumentParser(description = 'Train the FlipChip pattern tables from self-play')
+    parser.add_argument('--games', type = int, default = 5000, help = 'number of self-play games to learn from')
+    parser.add_argument('--epochs', type = int, default = 10, help = 'passes over the positions')
+    parser.add_argument('--rate', type = float, default = 0.01, help = 'learning rate')
+    parser.add_argument('--random', type = float, default = 0.2, help = 'how often the players move at random')
+    parser.add_argument('--seed', type = int, default = None, help = 'seed (so training can be repeated)')
+    parser.add_argument('--output', default = PATTERN_FILE, help = 'where to write the tables')
+    return parser.parse_args(lstArgs)
+
+
+
+
+# This is where code execution actually starts
+
+if __name__ == '__main__':
+    args = parse_args()
+    fltStart = time.perf_counter()
+    lstPositions = training_positions(args.games, args.random, args.seed)
+    print("Collected %d positions from %d games" % (len(lstPositions), args.games))
+    fit(lstPositions, args.epochs, args.rate, args.seed).save(args.output)
+    print("Wrote %s in %.1f seconds" % (args.output, time.perf_counter() - fltStart))
+    sys.exit(0)
@@ -30,92 +30,141 @@
 #                                                   for diagonals - it was returning a valid diagonal
 #                                                   when the line wrapped around the vertical edges of
 #                                                   the board.
+#                      17Oct2026    A.S.Harrison    best_move can now use the bitboard engine in
+#                                                   Bitboard.py (see USE_BITBOARD) which finds every
+#                                                   legal move with a few shifts instead of calling
+#                                                   line_points for each cell and direction.
+#                      17Oct2026    A.S.Harrison    The game rules now live in GameCore.py and this
+#                                                   class just wraps a GameCore instance, so games
+#                                                   can be played without a display (see SelfPlay.py).
+#                                                   This also fixes reset, which was regenerating a
+#                                                   local PlaySequence rather than the global one.
+#                      17Oct2026    A.S.Harrison    The computer now looks ahead using an alpha-beta
+#                                                   search (see Search.py and COMPUTER_STRATEGY).
+#                      17Oct2026    A.S.Harrison    The computer now thinks in a separate process
+#                                                   (iterative deepening for THINKING_SECONDS) and its
+#                                                   move highlight is scheduled with after() rather
+#                                                   than time.sleep, so the window no longer freezes.
+#                      17Oct2026    A.S.Harrison    The chips are now created once and recoloured when
+#                                                   they change, rather than drawing 64 new ovals every
+#                                                   move (the canvas was growing for every move played).
+#                      17Oct2026    A.S.Harrison    Once there are ENDGAME_EMPTIES empty cells or fewer
+#                                                   the computer solves the rest of the game exactly
+#                                                   (see Endgame.py) and the final score it has proved
+#                                                   is shown in the window title.
+#                      17Oct2026    A.S.Harrison    The computer's search can be shared out across
+#                                                   SEARCH_WORKERS processes.
+#                      17Oct2026    A.S.Harrison    The board size can be chosen on the command line
+#                                                   (e.g. python FlipChip.py --size 12). The search and
+#                                                   the endgame solver only work on an 8x8 board, so
+#                                                   on other sizes the computer plays greedily.
+#                      17Oct2026    A.S.Harrison    Every finished game is saved to ARCHIVE_FILE (see
+#                                                   GameRecord.py) before the board is reset.
+#                      17Oct2026    A.S.Harrison    --profile counts and times what happens in each
+#                                                   turn (see Profiler.py), showing it in a status line
+#                                                   under the board and logging it to a file.
+#                      17Oct2026    A.S.Harrison    The alpha-beta search only ever runs in the thinking
+#                                                   process, if it can't be used there the computer
+#                                                   plays greedily rather than freezing the window.
+#                      17Oct2026    A.S.Harrison    SEARCH_WORKERS defaults to 1, and the searcher is
+#                                                   started as soon as the thinking process is, so the
+#                                                   first move doesn't lose its thinking time to it.
+#                      17Oct2026    A.S.Harrison    Games are only saved when --archive is given.
 #--------------------------------------------------------------------------------------------------
 
 import sys                                                              # Used when exitting the code
-import time                                                             # Used when pausing to show the player what the computer's move is going to be
-import random                                                           # For generating random numbers (used when deciding what the computer's next move is)
+import argparse                                                         # For reading the command line (the board size)
+import multiprocessing                                                  # The computer thinks in a separate process so the window stays responsive
+from concurrent.futures import ProcessPoolExecutor                      # For handing the search to that process
 from tkinter import *                                                   # For GUI functionality
 from tkinter import messagebox                                          # To get at the MsgBox (at the end of a game)
+from GameCore import *                                                  # The game rules and board constants
+import Bitboard                                                         # For passing the board to the search
+import Search                                                           # The computer's look-ahead search
+import Endgame                                                          # The computer's perfect play at the end of the game
+import GameRecord                                                       # For saving finished games
+import Profiler                                                         # For profiling each turn (only if it's turned on)
 
 # Define all the constants-------------------------------------------------------------------------
-SIZE_OF_BOARD = int(400)                                                # 400 pixel board size
-COLUMNS = int(8)                                                        # Define the grid size
-ROWS = COLUMNS                                                          # We always want a square board
-CELLS = int(COLUMNS * ROWS)                                             # Total number of cells
-CELL_SIZE = int(SIZE_OF_BOARD / COLUMNS)                                # Pixel width/height of one cell
-
-NORTH = int(-COLUMNS)                                                   # Direction constants - these are used when a
-SOUTH = int(COLUMNS)                                                    # chip is placed on the board and we need to
-WEST = int(-1)                                                          # flip chips in all these directions
-EAST = int(1)
-NORTH_EAST = int(-(COLUMNS - 1))
-SOUTH_EAST = int(COLUMNS + 1)
-SOUTH_WEST = int(COLUMNS - 1)
-NORTH_WEST = int(-(COLUMNS + 1))
-
-NO_CHIP = int(0)                                                        # This represents an empty square
-BLACK_CHIP = int(-1)                                                    # This represents a black chip
-WHITE_CHIP = int(+1)                                                    # This represents a white chip
-
-# Globals------------------------------------------------------------------------------------------
-Grid = [0] * CELLS                                                      # This represents the playing grid
-                                                                        # A value of -1 represents a black chip and
-                                                                        # A value of +1 represents a white chip
-
-PlaySequence = random.sample(list(range(0, CELLS, 1)), CELLS)           # This is used when the computer is selecting the next move
-                                                                        # It's to ensure that the computer evaluates moves in
-                                                                        # a different order for every game
-
-
-# This class looks after everything. Go to the end of the code to see where
+SIZE_OF_BOARD = int(400)                                                # 400 pixel board size (however many cells there are)
+
+COMPUTER_STRATEGY = STRATEGY_ALPHABETA                                  # How the computer chooses its moves (see GameCore.STRATEGIES)
+THINKING_SECONDS = float(1.0)                                           # How long the computer can think about each move (alpha-beta only)
+SEARCH_WORKERS = int(1)                                                 # How many processes the search is shared out across (1 searches in the thinking process itself, more hasn't been measured to be any quicker yet)
+POLL_MS = int(50)                                                       # How often to check whether the computer has finished thinking
+ENDGAME_EMPTIES = Endgame.DEFAULT_EMPTIES                               # Solve the rest of the game exactly once there are this many empty cells (0 never does)
+ENDGAME_SECONDS = Endgame.DEFAULT_SECONDS                               # How long to try solving before falling back on the normal search
+HIGHLIGHT_MS = int(500)                                                 # How long the computer's move is highlighted before it's played
+PROFILE_LOG = None                                                      # Where to log the profile of each turn (None turns the profiler off)
+ARCHIVE_FILE = None                                                     # Where finished games are saved (None doesn't save them, see --archive)
+
+
+# This class looks after the GUI. Go to the end of the code to see where
 # an instance of FlipChip is created and the GUI interactions are started
 class FlipChip():
 
     # This gets execute when an instance of FlipChip is created------------------------------------
     # This is where we do all the game initialisation
-    def __init__(me):
+    def __init__(me, intSize: int = COLUMNS, strProfileLog: str = PROFILE_LOG, strArchive: str = ARCHIVE_FILE):
         intWinX = int(0)
         intWinY = int(0)
+        me.game = GameCore(intSize = intSize)                           # The state of the current game
+        me.cell_size = int(SIZE_OF_BOARD / me.game.columns)             # Pixel width/height of one cell
+        me.thinking = None                                              # The computer's search while it's running (a Future)
+        me.archive = strArchive                                         # Where finished games are saved (None doesn't save them)
+        me.solving = bool(False)                                        # Whether that search is the endgame solver
+        me.computers_turn = bool(False)                                 # Ignore clicks while the computer is having its go
+        me.executor = None                                              # The process the computer thinks in (started when first needed)
         me.window = Tk()                                                # Create the window
         me.window.title('FlipChip')                                     # Set the window title
         me.canvas = Canvas(me.window, width = SIZE_OF_BOARD, height = SIZE_OF_BOARD, bg = 'green')  # Set the size and background colour
         me.window.resizable(width = False, height = False)              # Make it non-sizeable
         me.canvas.pack()                                                # This is some kind of geometry manager that looks after positioning of widgets - we don't have any widgets but without this line of code, nothing appears on the window
+        me.profiler = None                                              # Only created if profiling has been asked for
+        if strProfileLog is not None:
+            me.profiler = Profiler.Profiler(strProfileLog)
+            me.profiler.instrument(me.game, Profiler.GAME_METHODS, 'engine_ms') # Count and time the engine
+            me.profiler.instrument(me, Profiler.RENDER_METHODS, 'render_ms') # And the drawing
+            me.status = Label(me.window, anchor = W, font = ('TkFixedFont', 8)) # Where each turn's figures are shown
+            me.status.pack(fill = X)
         
         me.window.bind('<Button-1>', me.click)                          # Create an event handler for a left click on the board
 
         me.reset()                                                      # Starting positions
         me.draw_grid()                                                  # Draw the grid lines
+        me.create_chips()                                               # Create the chips (they all start off empty)
         me.draw_chips()                                                 # Draw the chips
         
 
     # This starts the GUI (which then raises the click event when the board is clicked)------------
     def mainloop(me):
         me.window.mainloop()
+        if me.executor is not None: me.executor.shutdown(wait = False, cancel_futures = True)  # Don't leave the thinking process behind
 
 
     # Fired when the board is clicked--------------------------------------------------------------
     def click(me, event):                                             
-        intRow = int(((event.y / CELL_SIZE)))                           # Calculate which row was clicked
-        intCol = int(((event.x / CELL_SIZE)))                           # Calculate which column was clicked
-        intCell = me.cell_from_coords(intRow, intCol)                   # Which grid cell is it?
-        if Grid[intCell] == NO_CHIP:                                    # If the cell doesn't have a chip in it
-            if me.move_points(+1, intCell) > 0:                         # If it will result in some of the opponents chips being turned over
-                me.make_move(WHITE_CHIP, intCell)                       # Then make the player's move
-                me.draw_chips()                                         # Redraw the chips
-                while True:                                             # Now start a loop (this is used when the computer has a go and then the human has no available moves)
-                    me.computer_move()                                  # And let the computer have a go
-                    if me.best_move(WHITE_CHIP, True) != -1: break      # If the human has any move available, quit the loop
-                    if me.finished(): break                             # If the game is finished, quit the loop
-        if me.finished():                                               # If there are no more valid moves for either player
+        if me.computers_turn: return                                    # Wait for the computer to finish its go
+        intRow = int(((event.y / me.cell_size)))                        # Calculate which row was clicked
+        intCol = int(((event.x / me.cell_size)))                        # Calculate which column was clicked
+        if intRow >= me.game.rows or intCol >= me.game.columns: return  # The cells don't always fill the canvas exactly
+        intCell = me.game.cell_from_coords(intRow, intCol)              # Which grid cell is it?
+        if me.game.grid[intCell] == NO_CHIP:                            # If the cell doesn't have a chip in it
+            if me.game.move_points(+1, intCell) > 0:                    # If it will result in some of the opponents chips being turned over
+                if me.profiler is not None: me.profiler.start_turn(WHITE_CHIP)
+                lstFlips = me.make_move(WHITE_CHIP, intCell)            # Then make the player's move
+                me.draw_chips([intCell] + lstFlips)                     # Redraw the chips that have changed
+                me.end_turn(intCell)
+                me.computer_move()                                      # And let the computer have a go (the rest happens in the background)
+                return
+        if me.game.finished():                                          # If there are no more valid moves for either player
             me.finish()                                                 # Display the results and ask if the user wants another game
 
 
     # Finish the current game----------------------------------------------------------------------
     def finish(me):                                                   
-        intScoreWhite = int(me.score(WHITE_CHIP))                       # Count the white tiles
-        intScoreBlack = int(me.score(BLACK_CHIP))                       # Count the black tiles
+        intScoreWhite = int(me.game.score(WHITE_CHIP))                  # Count the white tiles
+        intScoreBlack = int(me.game.score(BLACK_CHIP))                  # Count the black tiles
         strMsg = str("")                                                # Initialise the display string
         
         if intScoreWhite == intScoreBlack: strMsg = "It's a tie!\r\n"   # Build the display string
@@ -124,6 +173,7 @@ class FlipChip():
         strMsg = strMsg + "\r\nThere are no available moves left for either player\r\n" 
         strMsg = strMsg + "\r\nBlack has " + str(intScoreBlack) + " chips and White has " + str(intScoreWhite) + " chips\r\n" 
         strMsg = strMsg + "\r\nDo you want to play again?"
+        me.save_game()                                                  # Before the board is reset and the moves are lost
 
         if messagebox.askquestion("FlipChip", strMsg) == "yes":         # Ask the user if s/he wants to go again
             me.reset()                                                  # S/he does, so reset the board
@@ -132,222 +182,179 @@ class FlipChip():
             sys.exit()                                                  # So quit
 
 
-    # Play the computer's move---------------------------------------------------------------------
-    def computer_move(me): 
-        intBestCell = me.best_move(BLACK_CHIP, False)                   # Find the 'best' move for black
-        if intBestCell != -1:                                           # As long as we found a valid move
-            me.make_move(BLACK_CHIP, intBestCell)                       # Make the move
-            me.draw_chips()                                             # Redraw the chips
-        if me.finished():                                               # If there are no more valid moves for either player
-            me.finish()                                                 # Display the results and ask if the user wants another game
-
-
-    # Work out the best move for a colour----------------------------------------------------------
-    def best_move(me, intColor: int, blnAnyMove: bool):
-        i = int(0)                                                      # For looping through the cells
-        intCell = int(0)                                                # The cell currently being tested
-        intBestCell = int(-1)                                           # The cell that results in the best move (-1 means there are no moves available)
-        intFlips = int(0)                                               # Number of chips that are flipped in each possible move
-        intBestFlips = int(0)                                           # The best number of chips
-        intRow = int(0)                                                 # The row of the cell being tested
-        intCol = int(0)                                                 # The column of the cell being tested
-
-        for i in range(0, CELLS):                                       # For each cell in the grid
-            intCell = PlaySequence[i]                                   # This just randomises the order in which the computer evaluates the available moves
-            if Grid[intCell] == 0:                                      # If this is an empty cell
-                intFlips = me.move_points(intColor, intCell)            # See how many chips would be flipped if we played this cell
-                if intFlips > 0:                                        # If it is a valid move (i.e. some chips would be flipped)
-                    intRow = me.row_from_cell(intCell)                  # Get the row co-ordinate
-                    intCol = me.col_from_cell(intCell)                  # Get the column co-ordinate
-                    if intRow == 0 or intRow == ROWS-1:                 # If it's the left or right edge of the board
-                        intFlips += 256                                 # Then weight it heavily
-                    if intCol == 0 or intCol == ROWS-1:                 # If it's the top or bottom row of the board
-                        intFlips += 256                                 # Then weight it heavily
-                                                                        # Note that corners will get doubly weighted
-                if intFlips > intBestFlips:                             # If this is the best move we have found so far
-                    intBestCell = intCell                               # Remember its cell location
-                    intBestFlips = intFlips                             # And remember its weighting
-                    if blnAnyMove == True: break                        # If we're just looking if ANY move is available then we can quit the loop
-
-        return intBestCell                                              # Return the cell with the best move
-
-
-    # Calculate how many chips will be flipped for a given cell/colour-----------------------------
-    def move_points(me, intColor: int, intCell: int):
-        intRes = int(0)                                                 # Initialise the result
-
-        # Straight lines
-        intRes = intRes + me.line_points(intColor, intCell, NORTH)      # Add in the points gained from a line going UP from the cell being tested
-        intRes = intRes + me.line_points(intColor, intCell, SOUTH)      # Add in the points gained from a line going DOWN from the cell being tested
-        intRes = intRes + me.line_points(intColor, intCell, EAST)       # Add in the points gained from a line going RIGHT from the cell being tested
-        intRes = intRes + me.line_points(intColor, intCell, WEST)       # Add in the points gained from a line going LEFT from the cell being tested
-
-        # Diagonal lines
-        intRes = intRes + me.line_points(intColor, intCell, NORTH_EAST) # Add in the points gained from a line going UP & RIGHT from the cell being tested
-        intRes = intRes + me.line_points(intColor, intCell, SOUTH_EAST) # Add in the points gained from a line going DOWN & RIGHT from the cell being tested
-        intRes = intRes + me.line_points(intColor, intCell, SOUTH_WEST) # Add in the points gained from a line going DOWN & LEFT from the cell being tested
-        intRes = intRes + me.line_points(intColor, intCell, NORTH_WEST) # Add in the points gained from a line going UP & LEFT from the cell being tested
-
-        return intRes                                                   # Return the total number of chips that would be flipped
+    # Save the finished game to the archive--------------------------------------------------------
+    def save_game(me):
+        if me.archive is None: return                                   # Saving hasn't been asked for
+        try:
+            GameRecord.append_game(me.archive, me.game)
+        except OSError as e:                                            # Not being able to save shouldn't stop the next game
+            print("Couldn't save the game to " + me.archive + ": " + str(e), file = sys.stderr)
 
-    
-    # Calculate how many chips will be flipped for a given cell/colour/direction-------------------
-    def line_points(me, intColor: int, intCell: int, intDirection: int):
-        intRes = int(0)                                                 # Initialise the result
-        blnOther = bool(False)                                          # Have we found a chip of the opponents colour
-        intRowThen = int(me.row_from_cell(intCell))                     # Starting row
-        intColThen = int(me.col_from_cell(intCell))                     # Starting col
-        intRowNow = int(0)                                              # Ending row
-        intColNow = int(0)                                              # Ending col
-        intWorkingCell = int(intCell)                                   # Which cell are we examining
-
-        while 1:                                                        # Loop
-            intWorkingCell += intDirection                              # Move to the next cell in te specified direction
-            intRowNow = int(me.row_from_cell(intWorkingCell))           # Get the row of the new cell
-            intColNow = int(me.col_from_cell(intWorkingCell))           # Get the column of the new cell
-
-            if intWorkingCell < 0 or intWorkingCell > CELLS-1: return 0 # If we've gone off the grid, just quit
-
-            if intDirection == EAST or intDirection == WEST:            # For LEFT/ RIGHT directions
-                if intRowNow != intRowThen: return 0                    # We have to stay on the same row
-
-            if intDirection == NORTH_WEST or intDirection == SOUTH_WEST:    # For diagonally LEFT directions
-                if intColNow >= intColThen: return 0                    # We can't have moved to a higher column or be on the same column
-
-            if intDirection == NORTH_EAST or intDirection == SOUTH_EAST:    # For diagonally RIGHT directions
-                if intColNow <= intColThen: return 0                    # We can't have moved to a lower column or be on the same column
-
-            if Grid[intWorkingCell] == 0: return 0                      # If there's no chip in this cell then it's not a valid move
-
-            if blnOther == True:                                        # Have we previously come across an opponents chip yet
-                if Grid[intWorkingCell] == intColor: break              # If we have now come across one of our own chips then the run is finished so return the count
-                intRes += 1                                             # We ar mid-run so increment the count of chips that would be flipped
-            else:                                                       # Otherwise, we have not yet come across an opponents chip
-                if Grid[intWorkingCell] == me.other_color(intColor):    # If this is an opponents chip
-                    blnOther = True                                     # Then this is the start of a run of opponents chips
-                    intRes += 1                                         # Increment the count of chips that would be flipped
-                else:                                                   # Otherwise, it's not an opponents chip (must be one of ours)
-                    break                                               # So that's the end of the run and we can exit the loop
-    
-        return intRes                                                   # Return the number of chips that would be flipped
 
+    # Start the computer's move--------------------------------------------------------------------
+    # The computer's go is split into steps which Tk calls back with after(), so the window carries
+    # on responding while the computer thinks and while its move is highlighted:
+    # computer_move -> poll_computer (until the search is done) -> play_computer_move
+    def computer_move(me): 
+        me.computers_turn = True                                        # No clicking until the computer has finished
+        if me.profiler is not None: me.profiler.start_turn(BLACK_CHIP)
+        if me.game.best_move(BLACK_CHIP, True) == -1:                   # If the computer can't go
+            me.end_turn(-1)                                             # It passes
+            me.end_computer_move()                                      # Then it's straight back to the human (or the end of the game)
+            return
+        me.solving = False
+        if me.game.columns == Bitboard.COLUMNS:                         # The search and the solver only work on an 8x8 board
+            board = Bitboard.Bitboard.from_grid(me.game.grid)
+            me.solving = Endgame.empties(board.black, board.white) <= ENDGAME_EMPTIES # Near enough the end to work out the perfect move
+            if me.solving or COMPUTER_STRATEGY == STRATEGY_ALPHABETA:   # The search takes a while so run it in the background
+                if me.executor is None:                                 # Start the thinking process (spawn rather than fork a copy of Tk)
+                    me.executor = ProcessPoolExecutor(1, mp_context = multiprocessing.get_context('spawn'))
+                    me.executor.submit(Search.start_search, SEARCH_WORKERS) # Get the searcher ready before the first search's clock starts
+                if me.solving: me.thinking = me.think(Endgame.timed_solve, board.black, board.white, BLACK_CHIP, ENDGAME_SECONDS, THINKING_SECONDS)
+                else: me.thinking = me.think(Search.timed_search, board.black, board.white, BLACK_CHIP, THINKING_SECONDS, Search.MAX_DEPTH, SEARCH_WORKERS)
+                me.window.after(POLL_MS, me.poll_computer)              # Come back and see if it's finished
+                return
+        strStrategy = COMPUTER_STRATEGY
+        if strStrategy == STRATEGY_ALPHABETA: strStrategy = STRATEGY_GREEDY # Never search in the GUI's own process (the window would freeze)
+        me.highlight_computer_move(me.game.choose_move(BLACK_CHIP, strStrategy)) # The other strategies (and board sizes) are quick enough to just run
+
+
+    # Hand a search to the thinking process (through the profiler if it's turned on)---------------
+    def think(me, function, *args):
+        if me.profiler is not None: return me.executor.submit(Profiler.run_profiled, function, *args)
+        return me.executor.submit(function, *args)
+
+
+    # See if the computer has finished thinking----------------------------------------------------
+    def poll_computer(me):
+        if me.thinking is None: return                                  # The game has been reset
+        if not me.thinking.done():                                      # Still thinking
+            me.window.after(POLL_MS, me.poll_computer)                  # So come back later
+            return
+        tplResult = me.thinking.result()
+        if me.profiler is not None:                                     # The search sent back its figures as well
+            tplResult, dictStats = tplResult
+            me.profiler.add_thinking(dictStats)
+        intBestCell = tplResult[0]                                      # The best move the search found
+        me.thinking = None
+        if me.solving and tplResult[2]:                                 # The solver got to the end of the game
+            me.window.title('FlipChip - ' + Endgame.describe(tplResult[1], 'Black')) # So tell the player how it's going to end
+        me.highlight_computer_move(intBestCell)
+
+
+    # Highlight the computer's move so the player can see what it's going to be--------------------
+    def highlight_computer_move(me, intCell: int):
+        me.draw_cell(intCell,'lime')                                    # Highlight the cell
+        me.window.after(HIGHLIGHT_MS, me.play_computer_move, intCell)   # And play the move in half a second
 
-    # Given a colour, return the opposite colour---------------------------------------------------
-    def other_color(me, intColor: int):
-        if intColor == +1:                                              # If the colour is white
-            return -1                                                   # Return black
-        else:                                                           # Otherwise
-            return +1                                                   # Return white
 
+    # Play the computer's move---------------------------------------------------------------------
+    def play_computer_move(me, intCell: int):
+        me.draw_cell(intCell,'green')                                   # De-highlight the cell
+        lstFlips = me.make_move(BLACK_CHIP, intCell)                    # Make the move
+        me.draw_chips([intCell] + lstFlips)                             # Redraw the chips that have changed
+        me.end_turn(intCell)
+        me.end_computer_move()
 
-    # Actually place a chip and do all the flipping------------------------------------------------
-    def make_move(me, intColor: int, intCell: int):
 
-        if intColor == -1:                                              # If it's a black move (i.e. the computer's move)
-            me.draw_cell(intCell,'lime')                                # Highlight the cell
-            me.window.update()                                          # Make sure the UI is refreshed
-            time.sleep(.5)                                              # Wait half a second
-            me.draw_cell(intCell,'green')                               # De-highlight the cell
-            me.window.update()                                          # Make sure the UI is refreshed
+    # A turn has finished, show its profile (if the profiler is turned on)-------------------------
+    def end_turn(me, intCell: int):
+        if me.profiler is not None: me.status.config(text = me.profiler.end_turn(intCell, me.game))
 
-        Grid[intCell] = intColor                                        # Plant the chip colour into the grid
-        me.move_line(intColor, intCell, NORTH)                          # Do all the flipping
-        me.move_line(intColor, intCell, SOUTH)
-        me.move_line(intColor, intCell, EAST)
-        me.move_line(intColor, intCell, WEST)
 
-        me.move_line(intColor, intCell, NORTH_EAST)
-        me.move_line(intColor, intCell, SOUTH_EAST)
-        me.move_line(intColor, intCell, SOUTH_WEST)
-        me.move_line(intColor, intCell, NORTH_WEST)
+    # The computer has had its go------------------------------------------------------------------
+    def end_computer_move(me):
+        if me.game.best_move(WHITE_CHIP, True) != -1:                   # If the human has any move available
+            me.computers_turn = False                                   # Then it's their go
+        elif me.game.finished():                                        # If there are no more valid moves for either player
+            me.computers_turn = False
+            me.finish()                                                 # Display the results and ask if the user wants another game
+        else:                                                           # Otherwise the human has to pass
+            me.computer_move()                                          # So the computer goes again
 
 
-    # Flip the chips in a specified direction------------------------------------------------------
-    def move_line(me, intColor: int, intCell: int, intDirection: int):
-        intWorkingCell = int(intCell)                                   # Start off with the specified cell
-        if me.line_points(intColor, intWorkingCell, intDirection) > 0:  # If there are flips in the specified direction
-            while 1:                                                    # Loop
-                intWorkingCell += intDirection                          # Move in the specified direction
-                if Grid[intWorkingCell] == intColor: break              # If we've reached the end, exit the loop
-                Grid[intWorkingCell] = intColor                         # Flip the chip 
+    # Actually place a chip and do all the flipping------------------------------------------------
+    def make_move(me, intColor: int, intCell: int):
+        return me.game.make_move(intColor, intCell)                     # Let the game do all the flipping (it tells us which chips flipped)
 
 
-    # Draw an individual cell of the grid----------------------------------------------------------
+    # Highlight an individual cell of the grid-----------------------------------------------------
+    # There's only one highlight so it just gets moved to the cell, and hidden again for 'green'
     def draw_cell(me, intCell: int, intColor: int):
-        intRow = int(me.row_from_cell(intCell))                         # Get the row
-        intCol = int(me.col_from_cell(intCell))                         # Get the column
-                                                                        # Draw the cell in the requested colour
-        me.canvas.create_rectangle(intCol*CELL_SIZE+2,intRow*CELL_SIZE+2,(intCol+1)*CELL_SIZE-2,(intRow+1)*CELL_SIZE-2,outline=intColor,fill=intColor)
-
-
-    # Count up all the chips of a specifed colour (i.e. the player's score)------------------------
-    def score(me, intPlayer: int):
-        intScore = int(0)                                               # Initialise the score
-        for i in range(CELLS):                                          # For each cell in the grid
-            if Grid[i] == intPlayer: intScore += 1                      # If it contains this player's chip, increment the score
-        return intScore                                                 # Return the total value for this player
+        intRow = int(me.game.row_from_cell(intCell))                    # Get the row
+        intCol = int(me.game.col_from_cell(intCell))                    # Get the column
+        if intColor == 'green':                                         # Green is the board colour so just hide the highlight
+            me.canvas.itemconfigure(me.highlight, state = 'hidden')
+            return
+        me.canvas.coords(me.highlight, intCol*me.cell_size+2,intRow*me.cell_size+2,(intCol+1)*me.cell_size-2,(intRow+1)*me.cell_size-2) # Move it to the cell
+        me.canvas.itemconfigure(me.highlight, outline = intColor, fill = intColor, state = 'normal') # Show it in the requested colour
+        me.canvas.tag_raise(me.highlight)                               # Make sure it's in front of the chip
 
 
     # Draw the grid lines--------------------------------------------------------------------------
     def draw_grid(me):                                                
-        for i in range(ROWS-1):                                         # For each row
-            me.canvas.create_line((i + 1) * SIZE_OF_BOARD / ROWS, 0, (i + 1) * SIZE_OF_BOARD / ROWS, SIZE_OF_BOARD)       # Draw a vertical
-            me.canvas.create_line(0, (i + 1) * SIZE_OF_BOARD / COLUMNS, SIZE_OF_BOARD, (i + 1) * SIZE_OF_BOARD / COLUMNS) # Draw a horizontal
+        for i in range(me.game.rows-1):                                 # For each row
+            me.canvas.create_line((i + 1) * me.cell_size, 0, (i + 1) * me.cell_size, me.game.rows * me.cell_size)       # Draw a vertical
+            me.canvas.create_line(0, (i + 1) * me.cell_size, me.game.columns * me.cell_size, (i + 1) * me.cell_size)    # Draw a horizontal
+
+
+    # Create the canvas items for the chips and the highlight--------------------------------------
+    # This is only done once, after that the items are just recoloured (see draw_chip) so the
+    # canvas doesn't fill up with old ovals as the games go on
+    def create_chips(me):
+        me.chips = [0] * me.game.cells                                  # The canvas item for each cell's chip
+        me.drawn = [NO_CHIP] * me.game.cells                            # What each chip item is currently showing
+        for i in range(0, me.game.rows):                                # For each row
+            for j in range(0, me.game.columns):                         # For each column
+                me.chips[me.game.cell_from_coords(i,j)] = me.canvas.create_oval(j*me.cell_size+4,i*me.cell_size+4,(j+1)*me.cell_size-4,(i+1)*me.cell_size-4,outline='green',fill='green')
+        me.highlight = me.canvas.create_rectangle(0,0,0,0,outline='lime',fill='lime',state='hidden') # The computer's move highlight
 
     
-    # Draw all the chips that have been played so far----------------------------------------------
-    def draw_chips(me):                                               
-        for i in range(0, ROWS):                                        # For each row
-            for j in range(0, COLUMNS):                                 # For each column
-                me.draw_chip(i,j)                                       # Draw the chip
+    # Draw all the chips that have changed since they were last drawn------------------------------
+    # If we know which cells have changed (the move and its flips) then only those are checked
+    def draw_chips(me, lstCells: list = None):
+        if lstCells is None: lstCells = range(0, me.game.cells)         # Otherwise check them all
+        for i in lstCells:                                              # For each cell
+            if me.drawn[i] != me.game.grid[i]:                          # If the chip has changed (been placed or flipped)
+                me.draw_chip(me.game.row_from_cell(i),me.game.col_from_cell(i)) # Then redraw it
         me.window.update()                                              # Make sure the GUI is up to date
 
 
     # Draw an individual chip----------------------------------------------------------------------
     def draw_chip(me, intRow: int, intCol: int):                                
-        intCell = int(me.cell_from_coords(intRow,intCol))               # Calculate which cell we are drawing
+        intCell = int(me.game.cell_from_coords(intRow,intCol))          # Calculate which cell we are drawing
         chip_color = 'green'                                            # Default to green (i.e. no chip present)
-        if Grid[intCell] == BLACK_CHIP: chip_color = 'black'            # -1 indicates a black chip
-        if Grid[intCell] == WHITE_CHIP: chip_color = 'white'            # +1 indicates a white chip
-        me.canvas.create_oval(intCol*CELL_SIZE+4,intRow*CELL_SIZE+4,(intCol+1)*CELL_SIZE-4,(intRow+1)*CELL_SIZE-4,outline=chip_color,fill=chip_color)
-
-
-    # Calculate the cell number from the row and column coordinates--------------------------------
-    def cell_from_coords(me, intRow: int, intCol: int):
-        return intRow * ROWS + intCol                                   # Return the equivalent grid cell
-
-
-    # Calculate the row number from a cell number
-    def row_from_cell(me, intCell: int):
-        return int(intCell / COLUMNS)                                   # Easy one, just divide by the number of columns
-
-
-    # Calculate the column number from a cell number-----------------------------------------------
-    def col_from_cell(me, intCell: int):
-        return int(intCell % ROWS)                                      # It's the modulus (the remainder after dividing by ROWS)
+        if me.game.grid[intCell] == BLACK_CHIP: chip_color = 'black'    # -1 indicates a black chip
+        if me.game.grid[intCell] == WHITE_CHIP: chip_color = 'white'    # +1 indicates a white chip
+        me.canvas.itemconfigure(me.chips[intCell], outline=chip_color, fill=chip_color) # Recolour the chip's oval
+        me.drawn[intCell] = me.game.grid[intCell]                       # Remember what it's showing
 
 
     # Reset the grid to starting positions---------------------------------------------------------
     def reset(me): 
-        for i in range(0, CELLS):Grid[i] = NO_CHIP                      # Remove all chips (from previous game)
-        Grid[int(CELLS / 2 - COLUMNS / 2)] = BLACK_CHIP                 # Set up the starting chips in the centre of the board
-        Grid[int(CELLS / 2 - COLUMNS / 2 - 1)] = WHITE_CHIP
-        Grid[int(CELLS / 2 + COLUMNS / 2)] = WHITE_CHIP
-        Grid[int(CELLS / 2 + COLUMNS / 2 - 1)] = BLACK_CHIP
-        PlaySequence = random.sample(list(range(0, CELLS, 1)), CELLS)   # Regenerate the computer's playing order (i.e. the order in which the computer evaluates moves)
+        me.thinking = None                                              # Forget any search that's still running
+        me.computers_turn = False
+        me.game.reset()                                                 # Starting chips and a new playing order for the computer
+        me.window.title('FlipChip')                                     # Take any proven score off the title
 
 
-    # Is the game over?----------------------------------------------------------------------------
-    def finished(me):
-        if me.best_move(WHITE_CHIP, True) != -1: return False           # If there's a white move available then we've not finished
-        if me.best_move(BLACK_CHIP, True) != -1: return False           # If there's a black move available then we've not finished
-        return True                                                     # Otherwise the game is over
 
+# Read the command line----------------------------------------------------------------------------
+def parse_args(lstArgs: list = None):
+    parser = argparse.ArgumentParser(description = 'Play FlipChip against the computer')
+    parser.add_argument('--archive', nargs = '?', const = GameRecord.ARCHIVE_FILE, default = ARCHIVE_FILE, metavar = 'FILE',
+                        help = 'save every finished game to this archive (default file: %s, see GameRecord.py)' % GameRecord.ARCHIVE_FILE)
+    parser.add_argument('--profile', nargs = '?', const = Profiler.LOG_FILE, default = PROFILE_LOG, metavar = 'LOG',
+                        help = 'show how long each turn takes under the board and log it (default log: %s)' % Profiler.LOG_FILE)
+    parser.add_argument('--size', type = int, default = COLUMNS, help = 'rows (and columns) on the board, an even number from %d to %d' % (MIN_SIZE, MAX_SIZE))
+    return parser.parse_args(lstArgs)
 
 
 
-# This is where code execution actually starts
 
-reversi = FlipChip()                                                    # Create an instance of the game
-reversi.mainloop()                                                      # Start the GUI
+# This is where code execution actually starts
 
+if __name__ == '__main__':                                              # Only start the GUI when run as a program (not when imported)
+    args = parse_args()
+    reversi = FlipChip(args.size, args.profile, args.archive)           # Create an instance of the game
+    reversi.mainloop()                                                  # Start the GUI
@@ -0,0 +1,367 @@
+#--------------------------------------------------------------------------------------------------
+# Purpose            : The FlipChip game rules without any GUI
+#                      Everything to do with the state of a game (the grid, the computer's
+#                      playing order, finding and making moves, scoring) lives in a GameCore
+#                      instance, so games can be played without a display and as many games as
+#                      we like can exist at once (see SelfPlay.py).
+# Date Created       : 17Oct2026
+# Author             : A.S.Harrison
+# Amendment History  : Date         Author          Description
+#                      17Oct2026    A.S.Harrison    Created (moved out of FlipChip.py)
+#                      17Oct2026    A.S.Harrison    search_seconds gives alpha-beta a time budget.
+#                      17Oct2026    A.S.Harrison    make_move now returns the flipped cells so that
+#                                                   unmake_move can take a move back, and the legal
+#                                                   moves for each colour are kept in a set which is
+#                                                   updated as moves are made, so finished doesn't
+#                                                   have to search the whole board any more.
+#                      17Oct2026    A.S.Harrison    Pattern evaluation (see use_patterns), and the
+#                                                   alpha-beta strategy uses the trained pattern
+#                                                   tables when there are some.
+#                      17Oct2026    A.S.Harrison    Alpha-beta switches to the exact endgame solver
+#                                                   (see Endgame.py) once there are endgame_empties
+#                                                   empty cells or fewer.
+#                      17Oct2026    A.S.Harrison    The board size is now chosen when a game is
+#                                                   created (6x6 up to 16x16). Each size has a table
+#                                                   of the cells along every direction from every
+#                                                   cell (see board_rays), so line_points just walks
+#                                                   a list instead of checking for the edges (which is
+#                                                   where the diagonal wrap-around bug came from).
+#                      17Oct2026    A.S.Harrison    The cells played are kept in history so that a
+#                                                   finished game can be saved (see GameRecord.py).
+#                      17Oct2026    A.S.Harrison    With the bitboard engine the bitboards are kept up
+#                                                   to date by make_move/unmake_move rather than being
+#                                                   rebuilt from the grid after every move.
+#                      17Oct2026    A.S.Harrison    evaluate raises a ValueError if use_patterns hasn't
+#                                                   been called.
+#                      17Oct2026    A.S.Harrison    Removed move_line and next_cell, make_move walks the
+#                                                   rays itself so nothing used them any more.
+#--------------------------------------------------------------------------------------------------
+
+import random                                                           # For generating random numbers (used when deciding what the computer's next move is)
+import Bitboard                                                         # Bitboard move generation (much faster than line_points)
+import Search                                                           # Alpha-beta look-ahead search
+import Evaluation                                                       # Pattern based evaluation
+import Endgame                                                          # Perfect play at the end of the game
+
+# Define all the constants-------------------------------------------------------------------------
+COLUMNS = int(8)                                                        # Define the grid size (the default, each game can have its own size)
+ROWS = COLUMNS                                                          # We always want a square board
+CELLS = int(COLUMNS * ROWS)                                             # Total number of cells
+MIN_SIZE = int(6)                                                       # The smallest and largest boards allowed (the size
+MAX_SIZE = int(16)                                                      # also has to be even so the starting chips are in the centre)
+
+NORTH = int(-COLUMNS)                                                   # Direction constants - these are used when a
+SOUTH = int(COLUMNS)                                                    # chip is placed on the board and we need to
+WEST = int(-1)                                                          # flip chips in all these directions (the values are the steps on the default board)
+EAST = int(1)
+NORTH_EAST = int(-(COLUMNS - 1))
+SOUTH_EAST = int(COLUMNS + 1)
+SOUTH_WEST = int(COLUMNS - 1)
+NORTH_WEST = int(-(COLUMNS + 1))
+DIRECTIONS = (NORTH, SOUTH, EAST, WEST, NORTH_EAST, SOUTH_EAST, SOUTH_WEST, NORTH_WEST)
+DIRECTION_STEPS = {NORTH: (-1, 0), SOUTH: (1, 0), EAST: (0, 1), WEST: (0, -1),  # The (row, column) step for each direction
+                   NORTH_EAST: (-1, 1), SOUTH_EAST: (1, 1), SOUTH_WEST: (1, -1), NORTH_WEST: (-1, -1)}
+DIRECTION_INDEX = {DIRECTIONS[i]: i for i in range(len(DIRECTIONS))}    # Where each direction's ray is in the ray tables
+EDGE_POINTS = int(256)                                                  # What best_move adds for a move on an edge (so corners get it twice)
+
+NO_CHIP = int(0)                                                        # This represents an empty square
+BLACK_CHIP = int(-1)                                                    # This represents a black chip
+WHITE_CHIP = int(+1)                                                    # This represents a white chip
+
+USE_BITBOARD = bool(COLUMNS == Bitboard.COLUMNS)                        # Use the bitboard engine to look for moves (only possible on an 8x8 board)
+
+STRATEGY_GREEDY = str('greedy')                                         # The computer's strategies - greedy is the original best_move
+STRATEGY_RANDOM = str('random')                                         # Random just plays any legal move
+STRATEGY_ALPHABETA = str('alphabeta')                                   # Alpha-beta looks search_depth moves ahead (see Search.py)
+STRATEGIES = (STRATEGY_GREEDY, STRATEGY_RANDOM, STRATEGY_ALPHABETA)
+
+# Globals------------------------------------------------------------------------------------------
+_ray_tables = {}                                                        # The ray tables for each board size (made the first time they're needed)
+
+
+# Return the ray table for a board size------------------------------------------------------------
+# For each cell there is a ray for each of the DIRECTIONS, the cells you pass going from that cell
+# to the edge of the board in that direction, nearest first. Working these out once per board size
+# means that moving along a line never has to check whether it has wrapped around an edge
+def board_rays(intSize: int):
+    if intSize not in _ray_tables:
+        lstRays = []
+        for intCell in range(intSize * intSize):
+            intRow, intCol = divmod(intCell, intSize)
+            lstCellRays = []
+            for intDirection in DIRECTIONS:
+                intRowStep, intColStep = DIRECTION_STEPS[intDirection]
+                lstRay = []
+                intRowNow, intColNow = intRow + intRowStep, intCol + intColStep
+                while 0 <= intRowNow < intSize and 0 <= intColNow < intSize: # Until we fall off the board
+                    lstRay.append(intRowNow * intSize + intColNow)
+                    intRowNow, intColNow = intRowNow + intRowStep, intColNow + intColStep
+                lstCellRays.append(tuple(lstRay))
+            lstRays.append(tuple(lstCellRays))
+        _ray_tables[intSize] = tuple(lstRays)
+    return _ray_tables[intSize]
+
+
+# This class holds the state of a single game------------------------------------------------------
+class GameCore():
+
+    # Create a new game----------------------------------------------------------------------------
+    # intSeed seeds the computer's playing order so that a game can be repeated exactly, and intSize
+    # is the number of rows (and columns) on the board
+    def __init__(me, intSeed: int = None, blnBitboard: bool = USE_BITBOARD, intSize: int = COLUMNS):
+        if intSize < MIN_SIZE or intSize > MAX_SIZE or intSize % 2 != 0:
+            raise ValueError("The board size must be an even number from " + str(MIN_SIZE) + " to " + str(MAX_SIZE))
+        me.columns = int(intSize)                                       # The size of this game's board
+        me.rows = me.columns
+        me.cells = me.columns * me.rows
+        me.rays = board_rays(me.columns)                                # The cells in each direction from each cell
+        me.edge_points = [EDGE_POINTS * ((i < me.columns or i >= me.cells - me.columns) + (i % me.columns in (0, me.columns - 1))) # best_move's weighting for each cell
+                          for i in range(me.cells)]
+        me.use_bitboard = bool(blnBitboard) and me.columns == Bitboard.COLUMNS # Which engine to use when looking for moves (bitboards are 8x8 only)
+        me.grid = [NO_CHIP] * me.cells                                  # This represents the playing grid
+                                                                        # A value of -1 represents a black chip and
+                                                                        # A value of +1 represents a white chip
+        me.play_sequence = list(range(me.cells))                        # This is used when the computer is selecting the next move
+        me.seed = None                                                  # The seed used to generate play_sequence
+        me.history = []                                                 # The cells played so far this game, in order (passes aren't recorded)
+        me.moves = {WHITE_CHIP: set(), BLACK_CHIP: set()}               # The legal moves for each colour (kept up to date by make_move)
+        me.black = int(0)                                               # With the bitboard engine, the grid as bitboards (also
+        me.white = int(0)                                               # kept up to date by make_move)
+        me.patterns = None                                              # Pattern numbers for evaluate (see use_patterns)
+        me.random = random.Random()                                     # Each game has its own random number generator
+        me.search_depth = Search.DEFAULT_DEPTH                          # How far ahead the alpha-beta strategy looks
+        me.search_seconds = None                                        # If set, alpha-beta deepens until this time budget runs out instead
+        me.searcher = None                                              # Created the first time alpha-beta is used (it holds a big table)
+        me.endgame_empties = Endgame.DEFAULT_EMPTIES                    # Alpha-beta solves the rest of the game exactly from this many empty cells (0 never does)
+        me.solver = None                                                # The endgame solver (created the first time it's needed)
+        me.proven_score = None                                          # The final chip difference the solver proved for its last move (None if it wasn't used)
+        me.reset(intSeed)                                               # Starting positions
+
+
+    # Reset the grid to starting positions---------------------------------------------------------
+    def reset(me, intSeed: int = None):
+        if intSeed is None: intSeed = random.getrandbits(32)            # Pick a new seed if we haven't been given one
+        me.seed = int(intSeed)                                          # Remember it so the game can be repeated
+        me.random.seed(me.seed)
+        for i in range(0, me.cells): me.grid[i] = NO_CHIP               # Remove all chips (from previous game)
+        me.history = []                                                 # And forget its moves
+        me.grid[int(me.cells / 2 - me.columns / 2)] = BLACK_CHIP        # Set up the starting chips in the centre of the board
+        me.grid[int(me.cells / 2 - me.columns / 2 - 1)] = WHITE_CHIP
+        me.grid[int(me.cells / 2 + me.columns / 2)] = WHITE_CHIP
+        me.grid[int(me.cells / 2 + me.columns / 2 - 1)] = BLACK_CHIP
+        me.play_sequence = me.random.sample(list(range(0, me.cells, 1)), me.cells)  # Regenerate the computer's playing order (i.e. the order in which the computer evaluates moves)
+        me.refresh_moves()                                              # Work out the legal moves for the starting position
+        if me.patterns is not None: me.patterns.set_grid(me.grid)       # And the pattern numbers if we're using them
+
+
+    # Choose a move for a colour using one of the STRATEGIES---------------------------------------
+    def choose_move(me, intColor: int, strStrategy: str = STRATEGY_GREEDY):
+        if strStrategy == STRATEGY_GREEDY:                              # The original one-ply pick
+            return me.best_move(intColor, False)
+        if strStrategy == STRATEGY_RANDOM:                              # Any legal move will do
+            lstMoves = me.legal_moves(intColor)
+            if len(lstMoves) == 0: return -1                            # No moves available
+            return me.random.choice(lstMoves)
+        if strStrategy == STRATEGY_ALPHABETA:                           # Look ahead
+            if me.columns != Bitboard.COLUMNS: return me.best_move(intColor, False) # The search only works on the 8x8 bitboards
+            board = Bitboard.Bitboard.from_grid(me.grid)
+            me.proven_score = None
+            if Endgame.empties(board.black, board.white) <= me.endgame_empties: # Near enough the end to work out the perfect move
+                if me.solver is None: me.solver = Endgame.Solver()      # The cache is kept between moves
+                intCell, me.proven_score = me.solver.solve(board.black, board.white, intColor)
+                return intCell
+            if me.searcher is None: me.searcher = Search.Searcher(me.search_depth, tables = Evaluation.default_tables()) # The table is kept between moves
+            if me.search_seconds is not None:                           # Iterative deepening to a time budget
+                return me.searcher.iterate(board.black, board.white, intColor, me.search_seconds)[0]
+            return me.searcher.search(board.black, board.white, intColor, me.search_depth)[0]
+        raise ValueError("Unknown strategy: " + str(strStrategy))
+
+
+    # Return a list of all the cells a colour can play---------------------------------------------
+    def legal_moves(me, intColor: int):
+        return sorted(me.moves[intColor])                               # These are kept up to date as moves are made
+
+
+    # Work out the best move for a colour----------------------------------------------------------
+    def best_move(me, intColor: int, blnAnyMove: bool):
+        i = int(0)                                                      # For looping through the cells
+        intCell = int(0)                                                # The cell currently being tested
+        intBestCell = int(-1)                                           # The cell that results in the best move (-1 means there are no moves available)
+        intFlips = int(0)                                               # Number of chips that are flipped in each possible move
+        intBestFlips = int(0)                                           # The best number of chips
+
+        if blnAnyMove == True:                                          # If we're just looking if ANY move is available
+            for intCell in me.moves[intColor]: return intCell           # Then the first legal move will do
+            return -1                                                   # (-1 if there aren't any)
+
+        if me.use_bitboard:                                             # If we're using the bitboard engine then let it do all the work
+            return Bitboard.Bitboard(me.black, me.white).best_move(intColor, blnAnyMove, me.play_sequence)
+
+        for i in range(0, me.cells):                                    # For each cell in the grid
+            intCell = me.play_sequence[i]                               # This just randomises the order in which the computer evaluates the available moves
+            if intCell in me.moves[intColor]:                           # If this is a legal move
+                intFlips = me.move_points(intColor, intCell)            # See how many chips would be flipped if we played this cell
+                if intFlips > 0:                                        # If it is a valid move (i.e. some chips would be flipped)
+                    intFlips += me.edge_points[intCell]                 # Then weight the edges of the board heavily
+                                                                        # Note that corners will get doubly weighted
+                if intFlips > intBestFlips:                             # If this is the best move we have found so far
+                    intBestCell = intCell                               # Remember its cell location
+                    intBestFlips = intFlips                             # And remember its weighting
+
+        return intBestCell                                              # Return the cell with the best move
+
+
+    # Calculate how many chips will be flipped for a given cell/colour-----------------------------
+    def move_points(me, intColor: int, intCell: int):
+        intRes = int(0)                                                 # Initialise the result
+        for tplRay in me.rays[intCell]:                                 # Add in the points gained from the line going out from the cell in each direction
+            intRes += me.ray_points(intColor, tplRay)
+        return intRes                                                   # Return the total number of chips that would be flipped
+
+
+    # Calculate how many chips will be flipped for a given cell/colour/direction-------------------
+    def line_points(me, intColor: int, intCell: int, intDirection: int):
+        return me.ray_points(intColor, me.rays[intCell][DIRECTION_INDEX[intDirection]])
+
+
+    # Calculate how many chips will be flipped along a ray (the cells going out from a cell)-------
+    # The ray stops at the edge of the board, so there's nothing to check apart from the chips
+    def ray_points(me, intColor: int, tplRay: tuple):
+        intRes = int(0)                                                 # Initialise the result
+        for intWorkingCell in tplRay:                                   # Move along the line one cell at a time
+            intChip = me.grid[intWorkingCell]
+            if intChip == intColor: return intRes                       # If we have come across one of our own chips then the run is finished so return the count (0 if there was no run)
+            if intChip == NO_CHIP: return 0                             # If there's no chip in this cell then it's not a valid move
+            intRes += 1                                                 # Otherwise it's an opponents chip so increment the count of chips that would be flipped
+        return 0                                                        # We've gone off the edge of the board without finding one of our chips
+
+
+    # Given a colour, return the opposite colour---------------------------------------------------
+    def other_color(me, intColor: int):
+        if intColor == +1:                                              # If the colour is white
+            return -1                                                   # Return black
+        else:                                                           # Otherwise
+            return +1                                                   # Return white
+
+
+    # Actually place a chip and do all the flipping------------------------------------------------
+    # Returns the list of cells that were flipped, which is all unmake_move needs to take it back
+    def make_move(me, intColor: int, intCell: int):
+        lstFlips = []                                                   # The chips that get flipped
+        me.grid[intCell] = intColor                                     # Plant the chip colour into the grid
+        for tplRay in me.rays[intCell]:                                 # Do all the flipping
+            for i in range(me.ray_points(intColor, tplRay)):            # For each chip in the run
+                me.grid[tplRay[i]] = intColor                           # Flip the chip
+                lstFlips.append(tplRay[i])                              # And remember it
+
+        me.update_moves([intCell] + lstFlips)                           # Only the cells in line with a changed chip can have changed
+        if me.patterns is not None: me.patterns.place(intColor, intCell, lstFlips) # Keep the pattern numbers up to date
+        me.history.append(intCell)                                      # Remember the move
+        return lstFlips
+
+
+    # Take back a move made by make_move-----------------------------------------------------------
+    def unmake_move(me, intColor: int, intCell: int, lstFlips: list):
+        me.grid[intCell] = NO_CHIP                                      # Take the chip off the board
+        intOther = me.other_color(intColor)
+        for i in lstFlips: me.grid[i] = intOther                        # And flip the flipped chips back
+        me.update_moves([intCell] + lstFlips)
+        me.history.pop()                                                # It's no longer part of the game
+        if me.patterns is not None: me.patterns.unplace(intColor, intCell, lstFlips)
+
+
+    # Evaluate the position with the pattern tables------------------------------------------------
+    # The pattern numbers are then kept up to date by make_move/unmake_move
+    def use_patterns(me, tables):
+        me.patterns = Evaluation.PatternState(tables)
+        me.patterns.set_grid(me.grid)
+
+
+    # How good the position is for a colour according to the pattern tables------------------------
+    # use_patterns has to have been called first (there are no tables to look the position up in)
+    def evaluate(me, intColor: int):
+        if me.patterns is None: raise ValueError("There are no pattern tables to evaluate with, call use_patterns first")
+        return me.patterns.value(intColor)
+
+
+    # Work out the legal moves for both colours from scratch---------------------------------------
+    def refresh_moves(me):
+        if me.use_bitboard:                                             # Build the bitboards from the grid and look the moves up on them
+            board = Bitboard.Bitboard.from_grid(me.grid)
+            me.black, me.white = board.black, board.white
+            me.bitboard_moves()
+            return
+        me.moves = {WHITE_CHIP: set(), BLACK_CHIP: set()}               # The cells each colour can play
+        for i in range(me.cells): me.check_move(i)                      # Check every cell
+
+
+    # Update the legal moves after some chips have changed-----------------------------------------
+    # Whether an empty cell is a legal move only depends on the lines running out from it, and a
+    # line stops at the first empty cell. So the only cells which can have changed are the changed
+    # chips themselves and the first empty cell along each direction from each changed chip. With the
+    # bitboard engine the changed cells are just copied into the bitboards, which then give every
+    # legal move in one go
+    def update_moves(me, lstChanged):
+        if me.use_bitboard:
+            for intCell in lstChanged:                                  # Bring the bitboards into step with the grid
+                intBit = 1 << intCell
+                if me.grid[intCell] == BLACK_CHIP: me.black |= intBit
+                else: me.black &= ~intBit
+                if me.grid[intCell] == WHITE_CHIP: me.white |= intBit
+                else: me.white &= ~intBit
+            me.bitboard_moves()
+            return
+        setCheck = set()                                                # The cells to check
+        for intCell in lstChanged:                                      # For each changed chip
+            setCheck.add(intCell)                                       # Check the cell itself (it may have just been emptied or filled)
+            for tplRay in me.rays[intCell]:                             # Then look in every direction
+                for intWorkingCell in tplRay:                           # Skip over the chips
+                    if me.grid[intWorkingCell] == NO_CHIP:
+                        setCheck.add(intWorkingCell)                    # And check the first empty cell
+                        break
+        for intCell in setCheck: me.check_move(intCell)
+
+
+    # Set the legal moves for both colours from the bitboards--------------------------------------
+    def bitboard_moves(me):
+        me.moves = {WHITE_CHIP: set(Bitboard.cells(Bitboard.legal_moves(me.white, me.black))),
+                    BLACK_CHIP: set(Bitboard.cells(Bitboard.legal_moves(me.black, me.white)))}
+
+
+    # See whether each colour can play a cell and update the legal moves---------------------------
+    def check_move(me, intCell: int):
+        for intColor in (WHITE_CHIP, BLACK_CHIP):                       # For both colours
+            if me.grid[intCell] == NO_CHIP and me.move_points(intColor, intCell) > 0: # If it would flip something
+                me.moves[intColor].add(intCell)                         # Then it's a legal move
+            else:
+                me.moves[intColor].discard(intCell)                     # Otherwise it isn't
+
+
+    # Count up all the chips of a specifed colour (i.e. the player's score)------------------------
+    def score(me, intPlayer: int):
+        intScore = int(0)                                               # Initialise the score
+        for i in range(me.cells):                                       # For each cell in the grid
+            if me.grid[i] == intPlayer: intScore += 1                   # If it contains this player's chip, increment the score
+        return intScore                                                 # Return the total value for this player
+
+
+    # Calculate the cell number from the row and column coordinates--------------------------------
+    def cell_from_coords(me, intRow: int, intCol: int):
+        return intRow * me.columns + intCol                             # Return the equivalent grid cell
+
+
+    # Calculate the row number from a cell number
+    def row_from_cell(me, intCell: int):
+        return int(intCell / me.columns)                                # Easy one, just divide by the number of columns
+
+
+    # Calculate the column number from a cell number-----------------------------------------------
+    def col_from_cell(me, intCell: int):
+        return int(intCell % me.columns)                                # It's the modulus (the remainder after dividing by the number of columns)
+
+
+    # Is the game over?----------------------------------------------------------------------------
+    def finished(me):
+        if me.moves[WHITE_CHIP]: return False                           # If there's a white move available then we've not finished
+        if me.moves[BLACK_CHIP]: return False                           # If there's a black move available then we've not finished
+        return True                                                     # Otherwise the game is over
@@ -0,0 +1,233 @@
+#--------------------------------------------------------------------------------------------------
+# Purpose            : Saving finished games to an archive file and analysing them afterwards
+#                      Each game is stored as a short header (the board size, the number of moves,
+#                      the seed of the computer's playing order and both final scores) followed by
+#                      one byte per move, the cell that was played. Passes aren't stored because
+#                      they can be worked out when the game is replayed - if the player whose turn
+#                      it is can't flip anything with the next move then they must have passed.
+#                      Games are appended to the end of the archive when it's asked for (see
+#                      FlipChip.py --archive and SelfPlay.py --archive). The archive is read through
+#                      a memory map, one game at a time, so it can hold millions of games without
+#                      them all being loaded.
+#                      e.g.  python GameRecord.py flipchip_games.fca --openings 6
+# Date Created       : 17Oct2026
+# Author             : A.S.Harrison
+# Amendment History  : Date         Author          Description
+#                      17Oct2026    A.S.Harrison    Created
+#                      17Oct2026    A.S.Harrison    Nothing is saved unless an archive is asked for.
+#--------------------------------------------------------------------------------------------------
+
+import os                                                               # For checking the size of the archive
+import sys                                                              # Used when exitting the code
+import mmap                                                             # For reading the archive without loading it all
+import time                                                             # For timing the analysis
+import struct                                                           # For packing the game headers
+import argparse                                                         # For reading the command line
+from collections import Counter                                         # For counting the openings
+from GameCore import *                                                  # The game rules and board constants
+import Bitboard                                                         # For replaying 8x8 games quickly
+
+# Define all the constants-------------------------------------------------------------------------
+ARCHIVE_FILE = str('flipchip_games.fca')                                # The archive read when none is given (and FlipChip.py --archive's default)
+MAGIC = b'FCA1'                                                         # The first bytes of every archive (and the format version)
+HEADER = struct.Struct('<BBIHH')                                        # Size, number of moves, seed, white chips, black chips (10 bytes)
+SEED_LIMIT = int(1 << 32)                                               # Seeds have to fit in 4 bytes (reset picks 32 bit seeds)
+OPENING_MOVES = int(4)                                                  # How many moves make an opening
+TOP_OPENINGS = int(10)                                                  # How many of the most common openings to report
+
+
+# Return the name of a cell, the column as a letter and the row as a number (e.g. d3)--------------
+def cell_name(intCell: int, intSize: int = COLUMNS):
+    return chr(ord('a') + intCell % intSize) + str(intCell // intSize + 1)
+
+
+# A single finished game---------------------------------------------------------------------------
+class GameRecord():
+
+    def __init__(me, intSize: int, intSeed: int, intWhite: int, intBlack: int, bytMoves: bytes):
+        me.size = int(intSize)                                          # Rows (and columns) on the board
+        me.seed = int(intSeed)                                          # The seed of the computer's playing order (see GameCore.reset)
+        me.white = int(intWhite)                                        # The final scores
+        me.black = int(intBlack)
+        me.moves = bytes(bytMoves)                                      # The cells played, in order
+
+
+    # Make a record of the game played so far on a GameCore----------------------------------------
+    @classmethod
+    def from_game(cls, game):
+        return cls(game.columns, game.seed, game.score(WHITE_CHIP), game.score(BLACK_CHIP), bytes(game.history))
+
+
+    # Pack the record into the archive format------------------------------------------------------
+    def encode(me):
+        if me.seed < 0 or me.seed >= SEED_LIMIT:                        # It wouldn't replay with the same playing order
+            raise ValueError("Only seeds from 0 to " + str(SEED_LIMIT - 1) + " can be saved")
+        return HEADER.pack(me.size, len(me.moves), me.seed, me.white, me.black) + me.moves
+
+
+    # Replay the game, returning (colour, cell, chips flipped) for each move-----------------------
+    # A ValueError is raised if a move isn't legal for either player (the record is corrupt)
+    def replay(me):
+        if me.size == Bitboard.COLUMNS: return me.replay_bitboard()     # Much quicker, and nearly every game is 8x8
+        return me.replay_grid()
+
+
+    # Replay an 8x8 game with bitboards------------------------------------------------------------
+    def replay_bitboard(me):
+        board = Bitboard.Bitboard()
+        board.reset()
+        intOwn, intOpp = board.sides(WHITE_CHIP)                        # White starts
+        intColor = WHITE_CHIP
+        for i, intCell in enumerate(me.moves):
+            if intCell >= Bitboard.CELLS or (intOwn | intOpp) >> intCell & 1: raise ValueError("Move " + str(i + 1) + " (" + cell_name(intCell) + ") isn't legal")
+            intFlips = Bitboard.flips(intOwn, intOpp, intCell)
+            if intFlips == 0:                                           # The player whose turn it was must have passed
+                intOwn, intOpp = intOpp, intOwn
+                intColor = -intColor
+                intFlips = Bitboard.flips(intOwn, intOpp, intCell)
+                if intFlips == 0: raise ValueError("Move " + str(i + 1) + " (" + cell_name(intCell) + ") isn't legal")
+            yield intColor, intCell, intFlips.bit_count()
+            intOwn, intOpp = intOpp & ~intFlips, intOwn | intFlips | (1 << intCell) # Make the move and swap sides
+            intColor = -intColor
+
+
+    # Replay a game of any size with a GameCore----------------------------------------------------
+    def replay_grid(me):
+        game = GameCore(me.seed, False, me.size)
+        intColor = WHITE_CHIP
+        for i, intCell in enumerate(me.moves):
+            if intCell >= game.cells or game.grid[intCell] != NO_CHIP: raise ValueError("Move " + str(i + 1) + " (" + cell_name(intCell, me.size) + ") isn't legal")
+            if game.move_points(intColor, intCell) == 0:                # The player whose turn it was must have passed
+                intColor = game.other_color(intColor)
+                if game.move_points(intColor, intCell) == 0: raise ValueError("Move " + str(i + 1) + " (" + cell_name(intCell, me.size) + ") isn't legal")
+            yield intColor, intCell, len(game.make_move(intColor, intCell))
+            intColor = game.other_color(intColor)
+
+
+    # Play the game back onto a new GameCore (with the same playing order as the original)---------
+    def to_game(me):
+        game = GameCore(me.seed, intSize = me.size)
+        for intColor, intCell, intFlips in me.replay(): game.make_move(intColor, intCell) # replay works out who played each move
+        return game
+
+
+# Append some games to the end of an archive (creating it if it's not there)-----------------------
+def append_records(strPath: str, lstRecords: list):
+    with open(strPath, 'ab') as f:
+        if f.tell() == 0: f.write(MAGIC)                                # A brand new archive
+        f.write(b''.join(record.encode() for record in lstRecords))
+
+
+# Append the game played on a GameCore to an archive-----------------------------------------------
+def append_game(strPath: str, game):
+    append_records(strPath, [GameRecord.from_game(game)])
+
+
+# Reads the games in an archive one at a time through a memory map---------------------------------
+class ArchiveReader():
+
+    def __init__(me, strPath: str):
+        me.path = strPath
+        me.file = open(strPath, 'rb')
+        me.map = None                                                   # An empty file can't be mapped (and has no games in it)
+        if os.fstat(me.file.fileno()).st_size > 0: me.map = mmap.mmap(me.file.fileno(), 0, access = mmap.ACCESS_READ)
+        if me.map is not None and me.map[0:len(MAGIC)] != MAGIC:
+            me.close()
+            raise ValueError(strPath + " is not a FlipChip game archive")
+        me.truncated = bool(False)                                      # Whether the last game was cut short (e.g. the program was killed while saving it)
+
+
+    def __enter__(me):
+        return me
+
+
+    def __exit__(me, *args):
+        me.close()
+
+
+    # Return the games one at a time---------------------------------------------------------------
+    def __iter__(me):
+        if me.map is None: return
+        intPos = len(MAGIC)
+        intEnd = len(me.map)
+        while intPos + HEADER.size <= intEnd:
+            intSize, intMoves, intSeed, intWhite, intBlack = HEADER.unpack_from(me.map, intPos)
+            intPos += HEADER.size
+            if intPos + intMoves > intEnd: break                        # Not all of its moves were saved
+            yield GameRecord(intSize, intSeed, intWhite, intBlack, me.map[intPos:intPos + intMoves])
+            intPos += intMoves
+        me.truncated = intPos != intEnd
+
+
+    def close(me):
+        if me.map is not None: me.map.close()
+        me.file.close()
+
+
+# Replay every game in an archive and work out some statistics-------------------------------------
+def analyse(strPath: str, intOpeningMoves: int = OPENING_MOVES):
+    dictStats = {'games': 0, 'white_wins': 0, 'black_wins': 0, 'ties': 0, 'white_chips': 0, 'black_chips': 0,
+                 'moves': 0, 'flips': 0, 'passes': 0, 'corrupt': 0, 'truncated': False, 'sizes': Counter(), 'openings': Counter()}
+    fltStart = time.perf_counter()
+    with ArchiveReader(strPath) as reader:
+        for record in reader:
+            intFlips = int(0)
+            intPasses = int(0)
+            intColor = WHITE_CHIP                                       # Whose turn it should be if nobody passes
+            try:
+                for intMoveColor, intCell, intCellFlips in record.replay():
+                    if intMoveColor != intColor: intPasses += 1         # The other player had to pass
+                    intFlips += intCellFlips
+                    intColor = -intMoveColor
+            except ValueError:
+                dictStats['corrupt'] += 1                               # Leave it out of the statistics
+                continue
+            dictStats['games'] += 1
+            if record.white > record.black: dictStats['white_wins'] += 1
+            if record.white < record.black: dictStats['black_wins'] += 1
+            if record.white == record.black: dictStats['ties'] += 1
+            dictStats['white_chips'] += record.white
+            dictStats['black_chips'] += record.black
+            dictStats['moves'] += len(record.moves)
+            dictStats['flips'] += intFlips
+            dictStats['passes'] += intPasses
+            dictStats['sizes'][record.size] += 1
+            if len(record.moves) >= intOpeningMoves:                    # Count the opening (with the board size, the cell numbers depend on it)
+                dictStats['openings'][(record.size, record.moves[:intOpeningMoves])] += 1
+        dictStats['truncated'] = reader.truncated
+    dictStats['seconds'] = time.perf_counter() - fltStart
+    return dictStats
+
+
+# Print the statistics for an archive--------------------------------------------------------------
+def report(dictStats: dict, intTop: int = TOP_OPENINGS):
+    intGames = max(1, dictStats['games'])                               # Avoid dividing by zero
+    print("Games       : %d (%s)" % (dictStats['games'], ', '.join('%dx%d: %d' % (i, i, n) for i, n in sorted(dictStats['sizes'].items()))))
+    print("Time        : %.2f seconds (%.1f games/sec)" % (dictStats['seconds'], dictStats['games'] / max(dictStats['seconds'], 1e-9)))
+    print("White wins  : %d (%.1f%%), average %.1f chips" % (dictStats['white_wins'], 100.0 * dictStats['white_wins'] / intGames, dictStats['white_chips'] / intGames))
+    print("Black wins  : %d (%.1f%%), average %.1f chips" % (dictStats['black_wins'], 100.0 * dictStats['black_wins'] / intGames, dictStats['black_chips'] / intGames))
+    print("Ties        : %d (%.1f%%)" % (dictStats['ties'], 100.0 * dictStats['ties'] / intGames))
+    print("Moves       : %.1f per game, %.2f chips flipped per move, %.2f passes per game" % (dictStats['moves'] / intGames, dictStats['flips'] / max(1, dictStats['moves']), dictStats['passes'] / intGames))
+    for (intSize, bytOpening), intCount in dictStats['openings'].most_common(intTop):
+        print("Opening     : %-20s %d (%.1f%%)" % (' '.join(cell_name(intCell, intSize) for intCell in bytOpening), intCount, 100.0 * intCount / intGames))
+    if dictStats['corrupt']: print("Corrupt     : %d games couldn't be replayed" % dictStats['corrupt'])
+    if dictStats['truncated']: print("Truncated   : the last game in the archive is incomplete")
+
+
+# Read the command line----------------------------------------------------------------------------
+def parse_args(lstArgs: list = None):
+    parser = argparse.ArgumentParser(description = 'Analyse an archive of FlipChip games')
+    parser.add_argument('archive', nargs = '?', default = ARCHIVE_FILE, help = 'the archive to read (default: %s)' % ARCHIVE_FILE)
+    parser.add_argument('--openings', type = int, default = OPENING_MOVES, help = 'how many moves make an opening')
+    parser.add_argument('--top', type = int, default = TOP_OPENINGS, help = 'how many of the most common openings to show')
+    return parser.parse_args(lstArgs)
+
+
+
+
+# This is where code execution actually starts
+
+if __name__ == '__main__':
+    args = parse_args()
+    report(analyse(args.archive, args.openings), args.top)
+    sys.exit(0)
@@ -0,0 +1,196 @@
+#--------------------------------------------------------------------------------------------------
+# Purpose            : Optional profiling of each turn in the GUI
+#                      When it is turned on (python FlipChip.py --profile) the profiler wraps the
+#                      engine methods of the game (best_move, move_points, make_move ...) and the
+#                      drawing methods of the GUI, so it can count the calls and time them. The
+#                      computer's search runs in another process, so that is run through
+#                      run_profiled which sends back the positions searched, the cache hits and
+#                      the number of move generations along with the move. At the end of each turn
+#                      the figures are shown under the board and written as a line of JSON to the
+#                      log file, which can be summarised afterwards to look for slowdowns.
+#                      When it is turned off nothing is wrapped, so the engine runs exactly as
+#                      it does without the profiler.
+#                      e.g.  python Profiler.py flipchip_profile.jsonl
+# Date Created       : 17Oct2026
+# Author             : A.S.Harrison
+# Amendment History  : Date         Author          Description
+#                      17Oct2026    A.S.Harrison    Created
+#                      17Oct2026    A.S.Harrison    "move gens" only counts full move generations
+#                                                   (best_move and Bitboard.legal_moves), looking
+#                                                   at single cells and lines is now counted
+#                                                   separately.
+#--------------------------------------------------------------------------------------------------
+
+import sys                                                              # Used when exitting the code
+import json                                                             # The log file format
+import time                                                             # For the timings
+import argparse                                                         # For reading the command line
+import Bitboard                                                         # For counting move generations in the search
+import Search                                                           # The searchers used in the thinking process
+import Endgame                                                          # And the endgame solver
+
+# Define all the constants-------------------------------------------------------------------------
+LOG_FILE = str('flipchip_profile.jsonl')                                # Where the turns are logged by default
+GAME_METHODS = ('choose_move', 'best_move', 'move_points', 'line_points', 'ray_points', 'make_move', 'update_moves') # The GameCore methods that get counted and timed
+MOVEGEN_METHODS = ('best_move',)                                        # The ones that generate every move on the board (as Bitboard.legal_moves does)
+CELL_PROBE_METHODS = ('move_points',)                                   # The ones that look at a single cell
+RAY_PROBE_METHODS = ('line_points', 'ray_points')                       # And the ones that look along a single line from a cell
+RENDER_METHODS = ('draw_chips', 'draw_cell')                            # The FlipChip methods that count as drawing
+PLAYER_NAMES = {Bitboard.WHITE_CHIP: 'White', Bitboard.BLACK_CHIP: 'Black'}
+
+
+# Counts and times the calls made during each turn-------------------------------------------------
+class Profiler():
+
+    def __init__(me, strLog: str = LOG_FILE):
+        me.log = strLog                                                 # The JSON lines file (None doesn't log)
+        me.turn = None                                                  # The figures for the turn in progress (None between turns)
+        me.start = float(0)                                             # perf_counter time the turn started
+        me.timing = bool(False)                                         # Whether a wrapped method is already being timed (so nested calls aren't counted twice)
+
+
+    # Replace some of an object's methods with ones that count and time the calls------------------
+    # strTimer is which time the calls are added to ('engine_ms' or 'render_ms')
+    def instrument(me, obj, tplMethods: tuple, strTimer: str):
+        for strName in tplMethods: setattr(obj, strName, me.wrap(getattr(obj, strName), strName, strTimer))
+
+
+    # Return a wrapped version of a method---------------------------------------------------------
+    def wrap(me, method, strName: str, strTimer: str):
+        def profiled(*args, **kwargs):
+            dictTurn = me.turn
+            if dictTurn is None: return method(*args, **kwargs)         # Not in a turn (e.g. setting up the board)
+            dictCalls = dictTurn['calls']
+            dictCalls[strName] = dictCalls.get(strName, 0) + 1
+            if me.timing: return method(*args, **kwargs)                # Called from a method that's already being timed
+            me.timing = True
+            fltStart = time.perf_counter()
+            try:
+                return method(*args, **kwargs)
+            finally:
+                dictTurn[strTimer] += 1000 * (time.perf_counter() - fltStart)
+                me.timing = False
+        return profiled
+
+
+    # Start a new turn-----------------------------------------------------------------------------
+    def start_turn(me, intColor: int):
+        me.turn = {'player': PLAYER_NAMES[intColor], 'calls': {}, 'movegen': 0, 'cell_probes': 0, 'ray_probes': 0, 'nodes': 0, 'cache_hits': 0, 'depth': None,
+                   'engine_ms': 0.0, 'think_ms': 0.0, 'render_ms': 0.0}
+        me.start = time.perf_counter()
+
+
+    # Add the figures sent back by run_profiled----------------------------------------------------
+    def add_thinking(me, dictStats: dict):
+        if me.turn is None: return
+        for strName in ('movegen', 'nodes', 'cache_hits'): me.turn[strName] += dictStats[strName]
+        me.turn['depth'] = dictStats['depth']
+        me.turn['think_ms'] += dictStats['ms']                          # The time the search took in its own process
+
+
+    # Finish the turn, log it and return the status line to show-----------------------------------
+    # intCell is the move that was played (-1 for a pass)
+    def end_turn(me, intCell: int, game):
+        dictTurn = me.turn
+        if dictTurn is None: return ''
+        me.turn = None
+        dictTurn['wall_ms'] = 1000 * (time.perf_counter() - me.start)   # Including waiting for the search and the highlight
+        dictTurn['movegen'] += sum(dictTurn['calls'].get(strName, 0) for strName in MOVEGEN_METHODS) # Full move generations only
+        dictTurn['cell_probes'] = sum(dictTurn['calls'].get(strName, 0) for strName in CELL_PROBE_METHODS) # Single cells and lines are kept separate
+        dictTurn['ray_probes'] = sum(dictTurn['calls'].get(strName, 0) for strName in RAY_PROBE_METHODS)
+        dictTurn.update({'time': time.strftime('%Y-%m-%d %H:%M:%S'), 'seed': game.seed, 'size': game.columns,
+                         'move': len(game.history), 'cell': intCell})
+        if me.log is not None:
+            with open(me.log, 'a') as f: f.write(json.dumps(dictTurn) + '\n')
+        return status(dictTurn)
+
+
+# Return the status line for a turn----------------------------------------------------------------
+def status(dictTurn: dict):
+    strMove = 'passed' if dictTurn['cell'] == -1 else 'move %d' % dictTurn['move']
+    strDepth = '' if dictTurn['depth'] is None else ' (depth %d)' % dictTurn['depth']
+    return '%s %s: %s nodes%s, %s move gens (%s cells, %s lines), %s cache hits | engine %.0f ms + search %.0f ms, drawing %.0f ms' % (
+           dictTurn['player'], strMove, format(dictTurn['nodes'], ','), strDepth, format(dictTurn['movegen'], ','),
+           format(dictTurn['cell_probes'], ','), format(dictTurn['ray_probes'], ','),
+           format(dictTurn['cache_hits'], ','), dictTurn['engine_ms'], dictTurn['think_ms'], dictTurn['render_ms'])
+
+
+# Return the searchers and solver that exist in this process---------------------------------------
+def engines():
+    return [engine for engine in (Search._searcher, Search._parallel, Endgame._solver) if engine is not None]
+
+
+# Return how many cache hits an engine has had so far----------------------------------------------
+def cache_hits(engine):
+    if isinstance(engine, Search.Searcher): return engine.table.hits
+    if isinstance(engine, Endgame.Solver): return engine.hits
+    return 0                                                            # A ParallelSearcher's tables are in its own processes
+
+
+# Run a search in the thinking process and send back some figures with its result------------------
+# Returns (result, stats). Bitboard.legal_moves is swapped for one that counts the calls while the
+# search runs. The searches of a ParallelSearcher's processes only show up in the nodes
+def run_profiled(function, *args):
+    lstCalls = [0]
+    legal_moves = Bitboard.legal_moves
+    def counted_legal_moves(intOwn: int, intOpp: int):
+        lstCalls[0] += 1
+        return legal_moves(intOwn, intOpp)
+    dictHits = {id(engine): cache_hits(engine) for engine in engines()}
+    for engine in engines(): engine.nodes = 0                           # So only the engines used by this search have any nodes
+    Bitboard.legal_moves = counted_legal_moves
+    fltStart = time.perf_counter()
+    try:
+        result = function(*args)
+    finally:
+        Bitboard.legal_moves = legal_moves
+    fltElapsed = time.perf_counter() - fltStart
+    lstEngines = engines()
+    lstDepths = [engine.completed_depth for engine in lstEngines if engine.nodes and hasattr(engine, 'completed_depth')]
+    return result, {'ms': 1000 * fltElapsed, 'movegen': lstCalls[0], 'nodes': sum(engine.nodes for engine in lstEngines),
+                    'cache_hits': sum(cache_hits(engine) - dictHits.get(id(engine), 0) for engine in lstEngines),
+                    'depth': max(lstDepths) if lstDepths else None}
+
+
+# Read a log and work out the average figures for each player--------------------------------------
+def summarise(strLog: str):
+    dictSummary = {}
+    with open(strLog) as f:
+        for strLine in f:
+            if not strLine.strip(): continue
+            dictTurn = json.loads(strLine)
+            dictPlayer = dictSummary.setdefault(dictTurn['player'], {'turns': 0, 'nodes': 0, 'movegen': 0, 'cell_probes': 0, 'ray_probes': 0, 'cache_hits': 0,
+                                                                     'engine_ms': 0.0, 'think_ms': 0.0, 'render_ms': 0.0, 'slowest_ms': 0.0})
+            dictPlayer['turns'] += 1
+            for strName in ('nodes', 'movegen', 'cell_probes', 'ray_probes', 'cache_hits', 'engine_ms', 'think_ms', 'render_ms'): dictPlayer[strName] += dictTurn.get(strName, 0)
+            dictPlayer['slowest_ms'] = max(dictPlayer['slowest_ms'], dictTurn['engine_ms'] + dictTurn['think_ms'])
+    return dictSummary
+
+
+# Print the summary of a log-----------------------------------------------------------------------
+def report(dictSummary: dict):
+    for strPlayer, dictPlayer in sorted(dictSummary.items()):
+        intTurns = max(1, dictPlayer['turns'])                          # Avoid dividing by zero
+        fltThinking = dictPlayer['engine_ms'] + dictPlayer['think_ms']
+        print("%-6s : %d turns, per turn %.0f nodes, %.0f move gens (%.0f cells, %.0f lines), %.0f cache hits" % (strPlayer, dictPlayer['turns'],
+              dictPlayer['nodes'] / intTurns, dictPlayer['movegen'] / intTurns, dictPlayer['cell_probes'] / intTurns, dictPlayer['ray_probes'] / intTurns,
+              dictPlayer['cache_hits'] / intTurns))
+        print("         engine %.1f ms (slowest %.1f ms), drawing %.1f ms, %.0f nodes/sec" % (fltThinking / intTurns, dictPlayer['slowest_ms'],
+              dictPlayer['render_ms'] / intTurns, 1000 * dictPlayer['nodes'] / max(dictPlayer['think_ms'], 1e-9)))
+
+
+# Read the command line----------------------------------------------------------------------------
+def parse_args(lstArgs: list = None):
+    parser = argparse.ArgumentParser(description = 'Summarise a FlipChip profile log')
+    parser.add_argument('log', nargs = '?', default = LOG_FILE, help = 'the JSON lines log to read (default: %s)' % LOG_FILE)
+    return parser.parse_args(lstArgs)
+
+
+
+
+# This is where code execution actually starts
+
+if __name__ == '__main__':
+    args = parse_args()
+    report(summarise(args.log))
+    sys.exit(0)
@@ -0,0 +1,434 @@
+#--------------------------------------------------------------------------------------------------
+# Purpose            : Look-ahead search for the computer's moves
+#                      A negamax search with alpha-beta pruning over the bitboards in Bitboard.py.
+#                      Positions are identified by a Zobrist hash (an XOR of a random number for
+#                      every chip on the board) which is updated as chips are placed and flipped,
+#                      and results are kept in a fixed size transposition table so that a position
+#                      reached by different move orders only gets searched once.
+# Date Created       : 17Oct2026
+# Author             : A.S.Harrison
+# Amendment History  : Date         Author          Description
+#                      17Oct2026    A.S.Harrison    Created
+#                      17Oct2026    A.S.Harrison    Iterative deepening against a time budget, and
+#                                                   timed_search for running it in another process.
+#                      17Oct2026    A.S.Harrison    Can evaluate with the pattern tables from
+#                                                   Evaluation.py, kept up to date move by move.
+#                      17Oct2026    A.S.Harrison    ParallelSearcher shares the moves at the root out
+#                                                   across a pool of processes (see timed_search).
+#                      17Oct2026    A.S.Harrison    start_search gets the searcher (and the pool's
+#                                                   processes) going before the first timed search, so
+#                                                   starting them doesn't use up its time budget.
+#--------------------------------------------------------------------------------------------------
+
+import os                                                               # To find out how many processors there are
+import time                                                             # For keeping to the time budget
+import random                                                           # For generating the Zobrist numbers
+import multiprocessing                                                  # For the shared best value when searching in parallel
+import multiprocessing.util                                             # For stopping the pool when the process it belongs to exits
+from concurrent.futures import ProcessPoolExecutor                      # For the pool of processes that search in parallel
+import Bitboard                                                         # Bitboard move generation
+import Evaluation                                                       # Pattern tables (if they've been trained)
+
+# Define all the constants-------------------------------------------------------------------------
+CELLS = Bitboard.CELLS
+BLACK_CHIP = Bitboard.BLACK_CHIP
+WHITE_CHIP = Bitboard.WHITE_CHIP
+
+DEFAULT_DEPTH = int(6)                                                  # How many moves ahead the computer looks
+DEFAULT_TABLE_BITS = int(18)                                            # The transposition table has 2 ** DEFAULT_TABLE_BITS slots
+DEFAULT_SECONDS = float(1.0)                                            # Time budget per move for iterative deepening
+MAX_DEPTH = int(60)                                                     # Iterative deepening never needs to go further than this
+CLOCK_NODES = int(1023)                                                 # Look at the clock every 1024 positions
+WIN_SCORE = int(100000)                                                 # A finished game is worth more than any evaluation
+INFINITY = int(10 * WIN_SCORE)
+
+EXACT = int(0)                                                          # Transposition table entry types - the value is exact,
+LOWER = int(1)                                                          # at least the stored value (it caused a beta cut-off)
+UPPER = int(2)                                                          # or at most the stored value (no move beat alpha)
+
+# How good each cell is to own, corners are best and the cells next to the corners are worst
+SQUARE_WEIGHTS = (100, -20,  10,   5,   5,  10, -20, 100,
+                  -20, -50,  -2,  -2,  -2,  -2, -50, -20,
+                   10,  -2,  -1,  -1,  -1,  -1,  -2,  10,
+                    5,  -2,  -1,  -1,  -1,  -1,  -2,   5,
+                    5,  -2,  -1,  -1,  -1,  -1,  -2,   5,
+                   10,  -2,  -1,  -1,  -1,  -1,  -2,  10,
+                  -20, -50,  -2,  -2,  -2,  -2, -50, -20,
+                  100, -20,  10,   5,   5,  10, -20, 100)
+MOBILITY_WEIGHT = int(5)                                                # What each extra available move is worth
+DEFAULT_WORKERS = int(os.cpu_count() or 1)                              # How many processes a parallel search uses
+
+# Globals------------------------------------------------------------------------------------------
+_rnd = random.Random(20221025)                                          # Fixed seed so hashes are the same in every process
+ZOBRIST_BLACK = tuple(_rnd.getrandbits(64) for i in range(CELLS))       # One random number per cell for a black chip
+ZOBRIST_WHITE = tuple(_rnd.getrandbits(64) for i in range(CELLS))       # And one for a white chip
+ZOBRIST_FLIP = tuple(ZOBRIST_BLACK[i] ^ ZOBRIST_WHITE[i] for i in range(CELLS))  # Flipping a chip swaps one number for the other
+ZOBRIST_WHITE_TO_MOVE = _rnd.getrandbits(64)                            # Mixed in when it's white's turn
+
+WEIGHT_MASKS = tuple((intWeight, sum(1 << i for i in range(CELLS) if SQUARE_WEIGHTS[i] == intWeight))
+                     for intWeight in sorted(set(SQUARE_WEIGHTS)))      # The cells for each weight, so evaluate is a few popcounts
+ORDER_MASKS = tuple(intMask for intWeight, intMask in sorted(WEIGHT_MASKS, reverse = True))  # Best cells first for move ordering
+
+
+# Calculate the Zobrist hash of a position from scratch--------------------------------------------
+def zobrist(intBlack: int, intWhite: int, intColor: int):
+    intHash = int(0)
+    for i in Bitboard.cells(intBlack): intHash ^= ZOBRIST_BLACK[i]      # Mix in every black chip
+    for i in Bitboard.cells(intWhite): intHash ^= ZOBRIST_WHITE[i]      # And every white chip
+    if intColor == WHITE_CHIP: intHash ^= ZOBRIST_WHITE_TO_MOVE         # And whose turn it is
+    return intHash
+
+
+# Update a Zobrist hash for a move (the same for either colour)------------------------------------
+def zobrist_move(intHash: int, intColor: int, intCell: int, intFlips: int):
+    if intColor == BLACK_CHIP: intHash ^= ZOBRIST_BLACK[intCell]        # The chip that has been placed
+    else: intHash ^= ZOBRIST_WHITE[intCell]
+    for i in Bitboard.cells(intFlips): intHash ^= ZOBRIST_FLIP[i]       # The chips that have been flipped
+    return intHash ^ ZOBRIST_WHITE_TO_MOVE                              # And it's now the other player's turn
+
+
+# Score a position from the point of view of the player owning intOwn------------------------------
+def evaluate(intOwn: int, intOpp: int):
+    intScore = int(0)
+    for intWeight, intMask in WEIGHT_MASKS:                             # Positional value of the chips
+        intScore += intWeight * ((intOwn & intMask).bit_count() - (intOpp & intMask).bit_count())
+    return intScore + mobility(intOwn, intOpp)
+
+
+# Score the difference in the number of moves available to each player-----------------------------
+def mobility(intOwn: int, intOpp: int):
+    return MOBILITY_WEIGHT * (Bitboard.legal_moves(intOwn, intOpp).bit_count() - Bitboard.legal_moves(intOpp, intOwn).bit_count())
+
+
+# Score a finished game, winning sooner or by more is better---------------------------------------
+def final_score(intOwn: int, intOpp: int):
+    intDiff = intOwn.bit_count() - intOpp.bit_count()                   # Chip difference
+    if intDiff > 0: return WIN_SCORE + intDiff
+    if intDiff < 0: return -WIN_SCORE + intDiff
+    return 0
+
+
+# Return a set of moves as a list of cells, best candidates first----------------------------------
+def ordered_moves(intMoves: int, intFirst: int = -1):
+    lstMoves = []
+    if intFirst >= 0 and intMoves >> intFirst & 1:                      # Try the move from the transposition table first
+        lstMoves.append(intFirst)
+        intMoves ^= 1 << intFirst
+    for intMask in ORDER_MASKS:                                         # Then corners, edges, ... down to the cells next to the corners
+        lstMoves.extend(Bitboard.cells(intMoves & intMask))
+    return lstMoves
+
+
+# Raised inside the search when the time budget runs out-------------------------------------------
+class SearchTimeout(Exception):
+    pass
+
+
+# A fixed size table of searched positions---------------------------------------------------------
+# Each slot holds (hash, depth, value, type, best move, generation). A new entry replaces the old
+# one if it is for the same position, was searched at least as deeply, or the old one is left over
+# from an earlier search (so the table doesn't fill up with stale deep entries)
+class TranspositionTable():
+
+    def __init__(me, intBits: int = DEFAULT_TABLE_BITS):
+        me.mask = (1 << intBits) - 1                                    # For turning a hash into a slot number
+        me.slots = [None] * (1 << intBits)                              # The table itself
+        me.generation = int(0)                                          # Incremented for every new search
+        me.hits = int(0)                                                # Statistics
+        me.stores = int(0)
+
+
+    # Start a new search (older entries become candidates for replacement)-------------------------
+    def new_search(me):
+        me.generation += 1
+
+
+    # Look up a position, returns None if it isn't in the table------------------------------------
+    def probe(me, intHash: int):
+        tplEntry = me.slots[intHash & me.mask]
+        if tplEntry is not None and tplEntry[0] == intHash:             # Check the whole hash (other positions share slots)
+            me.hits += 1
+            return tplEntry
+        return None
+
+
+    # Store a position-----------------------------------------------------------------------------
+    def store(me, intHash: int, intDepth: int, intValue: int, intType: int, intMove: int):
+        intSlot = intHash & me.mask
+        tplOld = me.slots[intSlot]
+        if tplOld is None or tplOld[0] == intHash or intDepth >= tplOld[1] or tplOld[5] != me.generation:
+            me.slots[intSlot] = (intHash, intDepth, intValue, intType, intMove, me.generation)
+            me.stores += 1
+
+
+    # Empty the table------------------------------------------------------------------------------
+    def clear(me):
+        me.slots = [None] * len(me.slots)
+
+
+# The searcher keeps its transposition table between moves so later searches benefit---------------
+class Searcher():
+
+    def __init__(me, intDepth: int = DEFAULT_DEPTH, intTableBits: int = DEFAULT_TABLE_BITS, tables = None):
+        me.depth = int(intDepth)                                        # How far to look ahead
+        me.patterns = None                                              # Pattern numbers for the position being searched
+        if tables is not None: me.patterns = Evaluation.PatternState(tables) # (None means use evaluate instead)
+        me.table = TranspositionTable(intTableBits)
+        me.nodes = int(0)                                               # Positions visited in the last search
+        me.deadline = None                                              # perf_counter time to give up by (None means no limit)
+        me.completed_depth = int(0)                                     # Deepest search finished by iterate
+
+
+    # Find the best move for a colour, returns (cell, value) with a cell of -1 if there's no move--
+    def search(me, intBlack: int, intWhite: int, intColor: int, intDepth: int = None):
+        if intDepth is None: intDepth = me.depth
+        if intColor == BLACK_CHIP: intOwn, intOpp = intBlack, intWhite
+        else: intOwn, intOpp = intWhite, intBlack
+        me.nodes = 0
+        me.table.new_search()
+        if me.patterns is not None: me.patterns.set_bits(intBlack, intWhite) # Start the pattern numbers off from this position
+        return me.root(intOwn, intOpp, intColor, zobrist(intBlack, intWhite, intColor), intDepth, -INFINITY, INFINITY)
+
+
+    # Iterative deepening - search 1 move ahead, then 2, ... until the time runs out---------------
+    # Returns the (cell, value) from the deepest search that finished. Each search puts its best
+    # moves in the table, so the next one tries them first and is much quicker than starting afresh
+    def iterate(me, intBlack: int, intWhite: int, intColor: int, fltSeconds: float = DEFAULT_SECONDS, intMaxDepth: int = MAX_DEPTH):
+        fltStart = time.perf_counter()
+        tplBest = (-1, 0)                                               # Nothing found yet
+        me.completed_depth = 0
+        intEmpties = CELLS - (intBlack | intWhite).bit_count()          # No point looking past the end of the game
+        intNodes = int(0)
+        for intDepth in range(1, max(1, min(intMaxDepth, intEmpties)) + 1):
+            me.deadline = None if intDepth == 1 else fltStart + fltSeconds  # Always finish depth 1 so there's a move to play
+            try:
+                tplBest = me.search(intBlack, intWhite, intColor, intDepth)
+            except SearchTimeout:                                       # Ran out of time part way through
+                intNodes += me.nodes
+                break
+            intNodes += me.nodes
+            me.completed_depth = intDepth
+            if tplBest[0] == -1: break                                  # There's nothing to play
+            if time.perf_counter() - fltStart > fltSeconds / 2: break   # The next depth would take longer than the time we have left
+        me.deadline = None
+        me.nodes = intNodes                                             # Report the total for all the depths
+        return tplBest
+
+
+    # Search the moves at the root, this is negamax but it remembers which move was best-----------
+    def root(me, intOwn: int, intOpp: int, intColor: int, intHash: int, intDepth: int, intAlpha: int, intBeta: int):
+        intMoves = Bitboard.legal_moves(intOwn, intOpp)
+        if intMoves == 0: return -1, 0                                  # Nothing to play
+        tplEntry = me.table.probe(intHash)
+        intBestCell = int(-1)
+        intBest = -INFINITY
+        for intCell in ordered_moves(intMoves, tplEntry[4] if tplEntry else -1):
+            intFlips = Bitboard.flips(intOwn, intOpp, intCell)
+            if me.patterns is not None:                                 # Keep the pattern numbers in step with the board
+                lstFlips = list(Bitboard.cells(intFlips))
+                me.patterns.place(intColor, intCell, lstFlips)
+            intValue = -me.negamax(intOpp & ~intFlips, intOwn | intFlips | (1 << intCell), -intColor,
+                                   zobrist_move(intHash, intColor, intCell, intFlips), intDepth - 1, -intBeta, -intAlpha, False)
+            if me.patterns is not None: me.patterns.unplace(intColor, intCell, lstFlips)
+            if intValue > intBest:                                      # Best move so far
+                intBest = intValue
+                intBestCell = intCell
+            if intValue > intAlpha: intAlpha = intValue
+        me.table.store(intHash, intDepth, intBest, EXACT, intBestCell)
+        return intBestCell, intBest
+
+
+    # Search a single move at the root for a ParallelSearcher--------------------------------------
+    # sharedAlpha is a multiprocessing.Value holding the best value any process has found for the
+    # root so far, so this move only has to be searched well enough to show whether it beats that.
+    # Returns (cell, value, exact, nodes) where exact is False if the value is only an upper bound
+    # (the move was no better than the shared best), or a value of None if the time ran out
+    def search_move(me, intBlack: int, intWhite: int, intColor: int, intCell: int, intDepth: int, sharedAlpha, fltDeadline: float = None):
+        if intColor == BLACK_CHIP: intOwn, intOpp = intBlack, intWhite
+        else: intOwn, intOpp = intWhite, intBlack
+        me.nodes = 0
+        me.table.new_search()
+        if fltDeadline is not None: me.deadline = time.perf_counter() + fltDeadline - time.time() # The deadline is a time.time() so it means the same in every process
+        intFlips = Bitboard.flips(intOwn, intOpp, intCell)
+        if me.patterns is not None:                                     # Start the pattern numbers off from the position after the move
+            me.patterns.set_bits(intBlack, intWhite)
+            me.patterns.place(intColor, intCell, list(Bitboard.cells(intFlips)))
+        intAlpha = sharedAlpha.value                                    # The best any process has found so far
+        try:
+            intValue = -me.negamax(intOpp & ~intFlips, intOwn | intFlips | (1 << intCell), -intColor,
+                                   zobrist_move(zobrist(intBlack, intWhite, intColor), intColor, intCell, intFlips), intDepth - 1, -INFINITY, -intAlpha, False)
+        except SearchTimeout:
+            return intCell, None, False, me.nodes
+        finally:
+            me.deadline = None
+        if intValue <= intAlpha: return intCell, intValue, False, me.nodes # No better than a move already searched
+        with sharedAlpha.get_lock():                                    # This is the best so far, so let the other processes know
+            if intValue > sharedAlpha.value: sharedAlpha.value = intValue
+        return intCell, intValue, True, me.nodes
+
+
+    # Negamax with alpha-beta pruning, returns the value for the player owning intOwn--------------
+    def negamax(me, intOwn: int, intOpp: int, intColor: int, intHash: int, intDepth: int, intAlpha: int, intBeta: int, blnPassed: bool):
+        me.nodes += 1
+        if me.deadline is not None and me.nodes & CLOCK_NODES == 0:     # Every so often check the clock
+            if time.perf_counter() > me.deadline: raise SearchTimeout()
+        intAlphaIn = intAlpha                                           # Needed to decide the type of the table entry
+
+        intFirst = int(-1)
+        tplEntry = me.table.probe(intHash)
+        if tplEntry is not None:                                        # We've seen this position before
+            intFirst = tplEntry[4]                                      # Its best move is worth trying first
+            if tplEntry[1] >= intDepth:                                 # And if it was searched deeply enough we may not need to search it again
+                if tplEntry[3] == EXACT: return tplEntry[2]
+                if tplEntry[3] == LOWER and tplEntry[2] >= intBeta: return tplEntry[2]
+                if tplEntry[3] == UPPER and tplEntry[2] <= intAlpha: return tplEntry[2]
+
+        intMoves = Bitboard.legal_moves(intOwn, intOpp)
+        if intMoves == 0:                                               # We have to pass
+            if blnPassed: return final_score(intOwn, intOpp)            # And so did the opponent, so the game is over
+            return -me.negamax(intOpp, intOwn, -intColor, intHash ^ ZOBRIST_WHITE_TO_MOVE, intDepth, -intBeta, -intAlpha, True)
+        if intDepth <= 0:                                               # As far as we're looking
+            if me.patterns is not None: return me.patterns.value(intColor) + mobility(intOwn, intOpp) # The pattern tables if we have them
+            return evaluate(intOwn, intOpp)
+
+        intBestCell = int(-1)
+        intBest = -INFINITY
+        for intCell in ordered_moves(intMoves, intFirst):               # For each move, most promising first
+            intFlips = Bitboard.flips(intOwn, intOpp, intCell)
+            if me.patterns is not None:                                 # Keep the pattern numbers in step with the board
+                lstFlips = list(Bitboard.cells(intFlips))
+                me.patterns.place(intColor, intCell, lstFlips)
+            intValue = -me.negamax(intOpp & ~intFlips, intOwn | intFlips | (1 << intCell), -intColor,
+                                   zobrist_move(intHash, intColor, intCell, intFlips), intDepth - 1, -intBeta, -intAlpha, False)
+            if me.patterns is not None: me.patterns.unplace(intColor, intCell, lstFlips)
+            if intValue > intBest:
+                intBest = intValue
+                intBestCell = intCell
+                if intValue > intAlpha:
+                    intAlpha = intValue
+                    if intAlpha >= intBeta: break                       # The opponent won't allow this line so stop looking
+
+        if intBest <= intAlphaIn: intType = UPPER                       # Work out what sort of value we've found
+        elif intBest >= intBeta: intType = LOWER
+        else: intType = EXACT
+        me.table.store(intHash, intDepth, intBest, intType, intBestCell)
+        return intBest
+
+
+# Searches the moves at the root in a pool of processes (root splitting)---------------------------
+# Each root move is a separate job, best first, and whichever process is free takes the next one.
+# The processes share the best value found so far (a multiprocessing.Value) so that moves which
+# can't beat it are cut off as soon as possible, just as alpha-beta does within one process. Each
+# process keeps its own Searcher (and transposition table) for the life of the pool
+class ParallelSearcher():
+
+    def __init__(me, intWorkers: int = DEFAULT_WORKERS, intTableBits: int = DEFAULT_TABLE_BITS):
+        context = multiprocessing.get_context('spawn')                  # Spawn works everywhere (and doesn't copy the GUI)
+        me.workers = int(intWorkers)
+        me.alpha = context.Value('i', -INFINITY)                        # The best value found at the root so far, shared by every process
+        me.executor = ProcessPoolExecutor(me.workers, mp_context = context, initializer = _start_worker, initargs = (me.alpha, intTableBits))
+        multiprocessing.util.Finalize(me, me.executor.shutdown, exitpriority = 100) # Stop the pool when this process exits (and before its queues are closed, or the pool never stops)
+        me.ranking = {}                                                 # The value of each root move from the last search (for ordering the next one)
+        me.nodes = int(0)                                               # Positions visited in the last search (all processes)
+        me.completed_depth = int(0)                                     # Deepest search finished by iterate
+
+
+    # Find the best move for a colour, returns (cell, value) with a cell of -1 if there's no move--
+    # fltDeadline is a time.time() to give up by, if it's reached a SearchTimeout is raised
+    def search(me, intBlack: int, intWhite: int, intColor: int, intDepth: int = DEFAULT_DEPTH, fltDeadline: float = None):
+        if intColor == BLACK_CHIP: intOwn, intOpp = intBlack, intWhite
+        else: intOwn, intOpp = intWhite, intBlack
+        intMoves = Bitboard.legal_moves(intOwn, intOpp)
+        if intMoves == 0: return -1, 0                                  # Nothing to play
+        lstMoves = ordered_moves(intMoves)                              # Best first - by the last search if there was one
+        lstMoves.sort(key = lambda intCell: -me.ranking.get(intCell, -INFINITY))
+        me.alpha.value = -INFINITY
+        lstJobs = [me.executor.submit(search_root_move, intBlack, intWhite, intColor, intCell, intDepth, fltDeadline) for intCell in lstMoves]
+        lstResults = [job.result() for job in lstJobs]                  # Wait for all of them (so none are still using the shared value)
+        me.nodes = sum(tplResult[3] for tplResult in lstResults)
+        if any(tplResult[1] is None for tplResult in lstResults): raise SearchTimeout() # Some moves didn't get searched
+        me.ranking = {intCell: intValue for intCell, intValue, blnExact, intNodes in lstResults}
+        tplBest = (-1, -INFINITY)
+        for intCell, intValue, blnExact, intNodes in lstResults:        # In move order, so the first of any equal moves wins
+            if blnExact and intValue > tplBest[1]: tplBest = (intCell, intValue)
+        return tplBest
+
+
+    # Iterative deepening against a time budget, the same as Searcher.iterate----------------------
+    def iterate(me, intBlack: int, intWhite: int, intColor: int, fltSeconds: float = DEFAULT_SECONDS, intMaxDepth: int = MAX_DEPTH):
+        fltStart = time.time()
+        tplBest = (-1, 0)                                               # Nothing found yet
+        me.completed_depth = 0
+        me.ranking = {}                                                 # A new position, so the last ranking means nothing
+        intEmpties = CELLS - (intBlack | intWhite).bit_count()          # No point looking past the end of the game
+        intNodes = int(0)
+        for intDepth in range(1, max(1, min(intMaxDepth, intEmpties)) + 1):
+            fltDeadline = None if intDepth == 1 else fltStart + fltSeconds # Always finish depth 1 so there's a move to play
+            try:
+                tplBest = me.search(intBlack, intWhite, intColor, intDepth, fltDeadline)
+            except SearchTimeout:                                       # Ran out of time part way through
+                intNodes += me.nodes
+                break
+            intNodes += me.nodes
+            me.completed_depth = intDepth
+            if tplBest[0] == -1: break                                  # There's nothing to play
+            if time.time() - fltStart > fltSeconds / 2: break           # The next depth would take longer than the time we have left
+        me.nodes = intNodes                                             # Report the total for all the depths
+        return tplBest
+
+
+    # Start every process in the pool and wait until they're ready---------------------------------
+    # The pool only starts a process when it's given a job and none are free, so one job for each
+    # process (all handed out before any of them can finish) starts them all
+    def warm_up(me):
+        for job in [me.executor.submit(_worker_ready) for i in range(me.workers)]: job.result()
+
+
+    # Stop the pool of processes-------------------------------------------------------------------
+    def shutdown(me):
+        me.executor.shutdown(wait = True, cancel_futures = True)
+
+
+# Set up one of a ParallelSearcher's processes-----------------------------------------------------
+def _start_worker(sharedAlpha, intTableBits: int):
+    global _searcher, _shared_alpha
+    _shared_alpha = sharedAlpha
+    _searcher = Searcher(intTableBits = intTableBits, tables = Evaluation.default_tables())
+
+
+# Does nothing, it's used by warm_up to make sure a process has started----------------------------
+def _worker_ready():
+    return True
+
+
+# Search one root move, this is what runs in a ParallelSearcher's processes------------------------
+def search_root_move(intBlack: int, intWhite: int, intColor: int, intCell: int, intDepth: int, fltDeadline: float = None):
+    return _searcher.search_move(intBlack, intWhite, intColor, intCell, intDepth, _shared_alpha, fltDeadline)
+
+
+# Globals------------------------------------------------------------------------------------------
+_searcher = None                                                        # The searcher used by timed_search (one per process)
+_parallel = None                                                        # The parallel searcher used by timed_search (if it's been asked for more than one process)
+_shared_alpha = None                                                    # In a ParallelSearcher's process, the best value found at the root so far
+
+
+# Return the searcher timed_search uses in this process, creating it if need be--------------------
+# The searcher (and so its table) is kept for the life of the process so later moves benefit. With
+# more than one worker it's a ParallelSearcher, whose processes are all started before it's returned.
+# The GUI calls this as soon as its thinking process starts, so the first move gets its full time
+def start_search(intWorkers: int = 1):
+    global _searcher, _parallel
+    if intWorkers > 1:
+        if _parallel is None or _parallel.workers != intWorkers:        # Start the pool (or a new one if the size has changed)
+            if _parallel is not None: _parallel.shutdown()
+            _parallel = ParallelSearcher(intWorkers)
+            _parallel.warm_up()
+        return _parallel
+    if _searcher is None: _searcher = Searcher(tables = Evaluation.default_tables())
+    return _searcher
+
+
+# Run an iterative deepening search, this is what the GUI runs in its background process-----------
+# With more than one worker the root moves are shared out across a pool of that many processes
+def timed_search(intBlack: int, intWhite: int, intColor: int, fltSeconds: float = DEFAULT_SECONDS, intMaxDepth: int = MAX_DEPTH, intWorkers: int = 1):
+    return start_search(intWorkers).iterate(intBlack, intWhite, intColor, fltSeconds, intMaxDepth)
@@ -0,0 +1,108 @@
+#--------------------------------------------------------------------------------------------------
+# Purpose            : Play the computer against itself without a display
+#                      Thousands of games are shared out across a pool of processes and the
+#                      number of games per second and the win rates are reported at the end.
+#                      This is how changes to the computer's strategy get evaluated.
+#                      e.g.  python SelfPlay.py --games 10000 --white greedy --black random
+# Date Created       : 17Oct2026
+# Author             : A.S.Harrison
+# Amendment History  : Date         Author          Description
+#                      17Oct2026    A.S.Harrison    Created
+#                      17Oct2026    A.S.Harrison    --endgame sets when alpha-beta starts solving the
+#                                                   rest of the game exactly.
+#                      17Oct2026    A.S.Harrison    --size plays the games on a different sized board.
+#                      17Oct2026    A.S.Harrison    --archive saves every game (see GameRecord.py).
+#--------------------------------------------------------------------------------------------------
+
+import os                                                               # To find out how many processors there are
+import sys                                                              # Used when exitting the code
+import time                                                             # For timing the run
+import random                                                           # For picking the game seeds
+import argparse                                                         # For reading the command line
+import multiprocessing                                                  # For the pool of processes that play the games
+from GameCore import *                                                  # The game rules and board constants
+import Search                                                           # For the default search depth
+import Endgame                                                          # For the default endgame size
+import GameRecord                                                       # For saving the games
+
+
+# Play one complete game and return the seed, both scores and the moves----------------------------
+# White always goes first (just like the human does in the GUI)
+def play_game(tplArgs: tuple):
+    intSeed, strWhite, strBlack, intDepth, intEndgame, intSize = tplArgs # Unpack the arguments (the pool only passes one)
+    game = GameCore(intSeed, intSize = intSize)                         # A brand new game with its own playing order
+    game.search_depth = intDepth                                        # How far ahead alpha-beta looks
+    game.endgame_empties = intEndgame                                   # And when it starts solving the game exactly
+    intColor = WHITE_CHIP                                               # White starts
+    while not game.finished():                                          # Until neither player can go
+        if intColor == WHITE_CHIP: strStrategy = strWhite               # Pick the strategy for whoever's turn it is
+        else: strStrategy = strBlack
+        intCell = game.choose_move(intColor, strStrategy)               # Find the move
+        if intCell != -1: game.make_move(intColor, intCell)             # If there isn't one then this player has to pass
+        intColor = game.other_color(intColor)                           # Now it's the other player's turn
+    return intSeed, game.score(WHITE_CHIP), game.score(BLACK_CHIP), bytes(game.history)
+
+
+# Play a batch of games across a pool of processes and return the results--------------------------
+def run(intGames: int, strWhite: str, strBlack: str, intProcesses: int = None, intSeed: int = None, intDepth: int = Search.DEFAULT_DEPTH,
+        intEndgame: int = Endgame.DEFAULT_EMPTIES, intSize: int = COLUMNS, strArchive: str = None):
+    rnd = random.Random(intSeed)                                        # So that a whole run can be repeated
+    lstArgs = [(rnd.getrandbits(32), strWhite, strBlack, intDepth, intEndgame, intSize) for i in range(intGames)]
+    if intProcesses is None: intProcesses = os.cpu_count() or 1         # Default to one process per processor
+    intChunk = max(1, int(intGames / (intProcesses * 4)))               # Hand out the games in chunks to keep the overheads down
+
+    fltStart = time.perf_counter()
+    if intProcesses == 1:                                               # No point starting a pool for a single process
+        lstResults = [play_game(tplArgs) for tplArgs in lstArgs]
+    else:
+        with multiprocessing.Pool(intProcesses) as pool:
+            lstResults = list(pool.imap_unordered(play_game, lstArgs, intChunk))
+    fltElapsed = time.perf_counter() - fltStart
+    if strArchive is not None:                                          # Save the games (all at once, so the archive is only opened once)
+        GameRecord.append_records(strArchive, [GameRecord.GameRecord(intSize, intGameSeed, intWhite, intBlack, bytMoves) for intGameSeed, intWhite, intBlack, bytMoves in lstResults])
+
+    dictStats = {'games': len(lstResults), 'seconds': fltElapsed, 'processes': intProcesses,
+                 'white': strWhite, 'black': strBlack,
+                 'white_wins': 0, 'black_wins': 0, 'ties': 0, 'white_chips': 0, 'black_chips': 0}
+    for intGameSeed, intWhite, intBlack, bytMoves in lstResults:        # Add up the results
+        if intWhite > intBlack: dictStats['white_wins'] += 1
+        if intWhite < intBlack: dictStats['black_wins'] += 1
+        if intWhite == intBlack: dictStats['ties'] += 1
+        dictStats['white_chips'] += intWhite
+        dictStats['black_chips'] += intBlack
+    return dictStats
+
+
+# Print the results of a run-----------------------------------------------------------------------
+def report(dictStats: dict):
+    intGames = max(1, dictStats['games'])                               # Avoid dividing by zero
+    print("Games       : " + str(dictStats['games']) + " on " + str(dictStats['processes']) + " process(es)")
+    print("Time        : %.2f seconds (%.1f games/sec)" % (dictStats['seconds'], dictStats['games'] / max(dictStats['seconds'], 1e-9)))
+    print("White wins  : %d (%.1f%%) playing %s, average %.1f chips" % (dictStats['white_wins'], 100.0 * dictStats['white_wins'] / intGames, dictStats['white'], dictStats['white_chips'] / intGames))
+    print("Black wins  : %d (%.1f%%) playing %s, average %.1f chips" % (dictStats['black_wins'], 100.0 * dictStats['black_wins'] / intGames, dictStats['black'], dictStats['black_chips'] / intGames))
+    print("Ties        : %d (%.1f%%)" % (dictStats['ties'], 100.0 * dictStats['ties'] / intGames))
+
+
+# Read the command line----------------------------------------------------------------------------
+def parse_args(lstArgs: list = None):
+    parser = argparse.ArgumentParser(description = 'Play FlipChip against itself without a display')
+    parser.add_argument('--games', type = int, default = 1000, help = 'number of games to play')
+    parser.add_argument('--processes', type = int, default = None, help = 'size of the process pool (default: one per processor)')
+    parser.add_argument('--white', choices = STRATEGIES, default = STRATEGY_GREEDY, help = "white's strategy")
+    parser.add_argument('--black', choices = STRATEGIES, default = STRATEGY_GREEDY, help = "black's strategy")
+    parser.add_argument('--depth', type = int, default = Search.DEFAULT_DEPTH, help = 'how far ahead the alphabeta strategy looks')
+    parser.add_argument('--endgame', type = int, default = Endgame.DEFAULT_EMPTIES, help = 'alphabeta plays perfectly from this many empty cells (0 to turn off)')
+    parser.add_argument('--size', type = int, default = COLUMNS, help = 'rows (and columns) on the board, an even number from %d to %d' % (MIN_SIZE, MAX_SIZE))
+    parser.add_argument('--archive', default = None, help = 'append the games to this archive (see GameRecord.py)')
+    parser.add_argument('--seed', type = int, default = None, help = 'seed for the whole run (so it can be repeated)')
+    return parser.parse_args(lstArgs)
+
+
+
+
+# This is where code execution actually starts
+
+if __name__ == '__main__':
+    args = parse_args()
+    report(run(args.games, args.white, args.black, args.processes, args.seed, args.depth, args.endgame, args.size, args.archive))
+    sys.exit(0)